@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+ORFS LLM Response Cache
+
+A small exact-match cache for LLM responses used by llm_content_generator.py.
+Responses are stored in a SQLite file so regenerating the same feed across
+runs is served from disk, with an in-memory LRU tier in front for repeated
+lookups within a single run.
+
+Keys are the SHA-256 of the normalized request (provider, model, prompt, temperature).
+
+SemanticCache complements the exact-match cache by returning the response of
+a previous prompt whose embedding is nearly identical (cosine similarity at
+or above a threshold).
+"""
+
+import hashlib
+import json
+import math
+import operator
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Dot product of two vectors; math.sumprod is implemented in C on Python 3.12+
+_dot = getattr(math, "sumprod", None) or (lambda a, b: sum(map(operator.mul, a, b)))
+
+DEFAULT_CACHE_PATH = os.path.expanduser("~/.orfs_llm_cache.sqlite3")
+
+
+class LLMCache:
+    """Two-tier (memory + SQLite) cache mapping request keys to generated text."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, memory_size: int = 4096):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._db = sqlite3.connect(path)
+        self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._db.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, temperature: float) -> str:
+        """Build the cache key for a request."""
+        payload = json.dumps({"provider": provider, "model": model, "prompt": prompt, "temp": temperature}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        row = self._db.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        self._remember(key, row[0])
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response in both tiers."""
+        self._db.execute("INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", (key, value))
+        self._db.commit()
+        self._remember(key, value)
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._db.close()
+
+    def _remember(self, key: str, value: str) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+
+class SemanticCache:
+    """Embedding-similarity cache for near-duplicate prompts.
+    
+    Embeddings are L2-normalized and stored in the same SQLite file as the
+    exact-match cache. Lookups compare the query with every entry of a
+    namespace (provider, model, temperature and prompt kind) in one matrix
+    product when numpy is installed, or a dot-product loop otherwise. search()
+    is safe to call from a worker thread while add() runs. New entries are
+    written to SQLite in batches of flush_every, and on close().
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, threshold: float = 0.95, flush_every: int = 64):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.threshold = threshold
+        self.flush_every = flush_every
+        self._vectors: Dict[str, List[array]] = {}
+        self._values: Dict[str, List[str]] = {}
+        self._matrices: Dict[str, Any] = {}
+        self._pending: List[Tuple[str, bytes, str]] = []
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_responses (namespace TEXT NOT NULL, embedding BLOB NOT NULL, value TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+        for namespace, blob, value in self._db.execute("SELECT namespace, embedding, value FROM semantic_responses"):
+            vector = array("f")
+            vector.frombytes(blob)
+            self._remember(namespace, vector, value)
+
+    def search(self, namespace: str, embedding: Sequence[float]) -> Optional[Tuple[float, str]]:
+        """Return (similarity, response) of the closest entry if it meets the threshold."""
+        query = _normalize(embedding)
+        with self._lock:
+            # Entries are only ever appended, so a snapshot of the first n stays valid
+            values = self._values.get(namespace, [])
+            count = len(values)
+            if not count:
+                return None
+            if np is not None:
+                matrix = self._matrices.get(namespace)
+                if matrix is None:
+                    matrix = np.frombuffer(b"".join(v.tobytes() for v in self._vectors[namespace]), dtype=np.float32)
+                    matrix = self._matrices[namespace] = matrix.reshape(count, -1)
+            else:
+                vectors = self._vectors[namespace][:count]
+
+        if np is not None:
+            scores = matrix @ np.frombuffer(query.tobytes(), dtype=np.float32)
+            best = int(scores.argmax())
+            best_score = float(scores[best])
+        else:
+            best_score, best = max((_dot(query, vector), i) for i, vector in enumerate(vectors))
+
+        if best_score < self.threshold:
+            return None
+        return best_score, values[best]
+
+    def add(self, namespace: str, embedding: Sequence[float], value: str) -> None:
+        """Store a response under its prompt embedding."""
+        vector = _normalize(embedding)
+        with self._lock:
+            self._remember(namespace, vector, value)
+        self._pending.append((namespace, vector.tobytes(), value))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write entries added since the last flush to the database."""
+        if not self._pending:
+            return
+        self._db.executemany(
+            "INSERT INTO semantic_responses (namespace, embedding, value) VALUES (?, ?, ?)", self._pending
+        )
+        self._db.commit()
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush pending entries and close the underlying database."""
+        self.flush()
+        self._db.close()
+
+    def _remember(self, namespace: str, vector: array, value: str) -> None:
+        self._vectors.setdefault(namespace, []).append(vector)
+        self._values.setdefault(namespace, []).append(value)
+        self._matrices.pop(namespace, None)
+
+
+def _normalize(embedding: Sequence[float]) -> array:
+    norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+    return array("f", (x / norm for x in embedding))
@@ -5,22 +5,44 @@ ORFS LLM Content Generator Example
 This script demonstrates how to use the ORFS v1.1 marketing extensions
 to automatically generate engaging content using Large Language Models.
 
-It requires an LLM API key (OpenAI by default, but configurable for other providers).
+It requires an LLM API key (OpenAI by default; Anthropic is supported through the
+anthropic package). The local provider talks to an OpenAI-compatible server such
+as Ollama or vLLM when LOCAL_LLM_URL is set, and returns mock content otherwise.
 
 Usage:
   python llm_content_generator.py --input path/to/feed.json --output path/to/output.json
   python llm_content_generator.py --dish-id dish123 --input path/to/feed.json
   python llm_content_generator.py --restaurant-id rest123 --input path/to/feed.json
+  python llm_content_generator.py --input path/to/feed.json --provider openai --cache
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import itertools
 import json
 import os
+import random
+import re
 import sys
 import logging
-import requests
 import time
-from typing import Dict, List, Any, Optional, Union
+import httpx
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from anthropic import AsyncAnthropic
+except ImportError:
+    AsyncAnthropic = None
+
+from llm_cache import DEFAULT_CACHE_PATH, LLMCache, SemanticCache
 
 # Configure logging
 logging.basicConfig(
@@ -30,16 +52,291 @@ logging.basicConfig(
 
 # OpenAI API configuration
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+# Several comma-separated keys can be given to spread requests across accounts
+OPENAI_API_KEYS = [key.strip() for key in os.environ.get("OPENAI_API_KEYS", "").split(",") if key.strip()] or \
+    ([OPENAI_API_KEY] if OPENAI_API_KEY else [])
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_MODELS_URL = "https://api.openai.com/v1/models"
+OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+EMBEDDING_MODEL = "text-embedding-3-small"
 DEFAULT_MODEL = "gpt-3.5-turbo"  # Can be configured to other models
+DEFAULT_TEMPERATURE = 0.7
+
+# Anthropic configuration, used when --model is left at the OpenAI default
+ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
+DEFAULT_ANTHROPIC_MODEL = "claude-3-5-haiku-latest"
+ANTHROPIC_MAX_TOKENS = 1024
+
+# OpenAI-compatible chat completions endpoint for the local provider, e.g.
+# http://localhost:11434/v1/chat/completions (Ollama) or http://localhost:8000/v1/chat/completions (vLLM)
+LOCAL_LLM_URL = os.environ.get("LOCAL_LLM_URL", "")
+LOCAL_LLM_MODEL = os.environ.get("LOCAL_LLM_MODEL", "llama3.1")
 
 # LLM provider options
 SUPPORTED_PROVIDERS = ["openai", "anthropic", "local"]
 
+# Static system prompt shared by every request. Prompts keep invariant
+# instructions first and per-dish/restaurant details last so providers that
+# cache prompt prefixes can reuse them across the whole feed.
+SYSTEM_PROMPT = (
+    "You are a skilled food writer and marketer helping create engaging content for restaurants. "
+    "Write in a warm, vivid and authentic voice, using concrete sensory details rather than generic praise. "
+    "Stay within the requested length. "
+    "Return only the requested content, without titles, preambles or surrounding quotation marks. "
+    "When asked for a JSON object, return a single valid JSON object and nothing else."
+)
+
+# Maximum number of LLM requests in flight at once
+LLM_CONCURRENCY = int(os.environ.get("LLM_CONCURRENCY", "8"))
+_llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+
+# Request rate limit for the OpenAI API, and how often a rate-limited or failed (5xx) request is retried
+OPENAI_QPS = float(os.environ.get("OPENAI_QPS", "8"))
+MAX_REQUEST_RETRIES = 3
+
+# Headers shared by every API request; Authorization is added per request since keys rotate
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Generated dish content is logged to <output file> + this suffix until the output is saved
+CHECKPOINT_SUFFIX = ".ndjson"
+
+# Created on first use so the anthropic package is only needed for that provider
+_anthropic_client = None
+
+# Optional response cache, enabled with --cache or LLM_CACHE=1
+_llm_cache: Optional[LLMCache] = None
+
+# Optional near-duplicate prompt cache, enabled with --semantic-cache
+_semantic_cache: Optional[SemanticCache] = None
+
+# Sampling temperature for every request, set with --temperature
+_temperature = DEFAULT_TEMPERATURE
+
+# Field-specific prompts used when a dish or restaurant has no suggested_prompt_template.
+# Instructions come first and the item details last to keep a shared prompt prefix.
+_DISH_PROMPTS = {
+    "chef_story": "Write a compelling chef's story (100-150 words) for the dish below. Include details about the inspiration, culinary journey, and passion behind creating this dish.\n\n{details}",
+    "chef_highlight": "Write a brief highlight (30-50 words) about the chef's special connection to the dish below.\n\n{details}",
+    "seasonal_story": "Write a seasonal story (100-150 words) for the dish below, explaining how it connects to the current season, ingredients availability, and traditions.\n\n{details}",
+    "cultural_context": "Write about the cultural context (100-150 words) of the dish below. Include its origins, significance in its culture, and how it has evolved.\n\n{details}",
+    "ingredient_story": "Write a story (100-150 words) about the key ingredients in the dish below. Focus on sourcing, quality, and what makes these ingredients special.\n\n{details}"
+}
+_DISH_FALLBACK_PROMPT = "Write content for the {field} field of the dish below.\n\n{details}"
+
+_RESTAURANT_PROMPTS = {
+    "description": "Write an engaging description (100-150 words) for the restaurant below. Emphasize its key points.\n\n{details}",
+    "social_media_blurb": "Write a catchy social media bio (50-60 words) for the restaurant below that would work on Instagram or Facebook. Emphasize its key points.\n\n{details}",
+    "loyalty_program_promo": "Write a promotional blurb (30-40 words) for the loyalty program of the restaurant below that encourages customers to sign up. Emphasize its key points.\n\n{details}"
+}
+_RESTAURANT_FALLBACK_PROMPT = "Write content for the {field} field of the restaurant below.\n\n{details}"
+
+# Dish narrative fields generated by this script
+NARRATIVE_FIELDS = ("chef_story", "seasonal_story", "cultural_context", "ingredient_story", "chef_highlight")
+
+# What to ask for in each narrative field when generating all of a dish's fields in one request
+NARRATIVE_FIELD_GUIDES = {
+    "chef_story": "A compelling chef's story (100-150 words) including details about the inspiration, culinary journey, and passion behind creating this dish.",
+    "chef_highlight": "A brief highlight (30-50 words) about the chef's special connection to the dish.",
+    "seasonal_story": "A seasonal story (100-150 words) explaining how the dish connects to the current season, ingredients availability, and traditions.",
+    "cultural_context": "The cultural context (100-150 words) of the dish, including its origins, significance in its culture, and how it has evolved.",
+    "ingredient_story": "A story (100-150 words) about the key ingredients in the dish, focusing on sourcing, quality, and what makes these ingredients special."
+}
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _TemplateVars(dict):
+    """Template variables that render unknown placeholders as empty strings."""
+    
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+    
+    Tokens refill at rate_per_sec up to burst. The bucket can also be paused,
+    e.g. when the API answers 429 with a Retry-After header.
+    """
+    
+    def __init__(self, rate_per_sec: float, burst: int):
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_sec)
+    
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+
+_rate_limiter = TokenBucket(rate_per_sec=OPENAI_QPS, burst=16)
+
+
+class CheckpointLog:
+    """Append-only NDJSON log of generated dish content.
+    
+    The first line records the run (provider and resolved model); each further
+    line records the fields generated for one dish, written as soon as the
+    dish completes. If a run is interrupted, the next run with the same
+    provider and model restores these fields instead of asking the LLM again.
+    A log written by a different run is ignored and replaced.
+    """
+    
+    def __init__(self, path: str, run: Dict[str, str]):
+        self.path = path
+        self.run = run
+        self._file = None
+        self._resume = False
+    
+    def load(self) -> Dict[str, Dict]:
+        """Return fields generated by an earlier run of the same kind, keyed by dish ID."""
+        restored: Dict[str, Dict] = {}
+        try:
+            with open(self.path, "rb") as f:
+                for number, line in enumerate(f):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json_loads(line)
+                    except ValueError:
+                        # A crash can leave a truncated final line
+                        continue
+                    if number == 0:
+                        if record.get("run") != self.run:
+                            logging.warning(f"Ignoring {self.path}: it was written by a run with {record.get('run')}, "
+                                            f"not {self.run}")
+                            return {}
+                        self._resume = True
+                        continue
+                    restored.setdefault(record["id"], {}).update(record["updates"])
+        except FileNotFoundError:
+            pass
+        return restored
+    
+    def record(self, dish_id: str, updates: Dict) -> None:
+        """Append the fields generated for a dish."""
+        if self._file is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            if self._resume:
+                self._file = open(self.path, "ab")
+                # Never append onto a line truncated by an earlier crash
+                self._file.write(b"\n")
+            else:
+                self._file = open(self.path, "wb")
+                self._file.write(json_dumps({"run": self.run}) + b"\n")
+        
+        entry = {"id": dish_id, "updates": updates}
+        self._file.write(json_dumps(entry) + b"\n")
+        self._file.flush()
+    
+    def remove(self) -> None:
+        """Close and delete the log once its content is safely in the output feed."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+# Matches "with" as a whole word, so "without" or "withering" are not treated as ingredient lists
+_WITH_RE = re.compile(r"\bwith\b", re.IGNORECASE)
+
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: Optional[str], default: float) -> float:
+    """Parse a Retry-After or OpenAI reset header ("2", "1.5s", "6m0s", "20ms") into seconds."""
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts:
+        return default
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+_api_key_cycle = itertools.cycle(OPENAI_API_KEYS)
+_api_key_cooldown: Dict[str, float] = {}
+
+
+def next_api_key() -> str:
+    """Return the next OpenAI API key in round-robin order, skipping rate-limited keys."""
+    now = time.monotonic()
+    for _ in range(len(OPENAI_API_KEYS)):
+        key = next(_api_key_cycle)
+        if _api_key_cooldown.get(key, 0.0) <= now:
+            return key
+    
+    # Every key is cooling down; use the one that recovers first
+    return min(OPENAI_API_KEYS, key=lambda key: _api_key_cooldown.get(key, 0.0))
+
+
+def observe_rate_limit(response: httpx.Response, api_key: str) -> None:
+    """Throttle based on OpenAI's rate-limit response headers.
+    
+    The key that hit its limit cools down; the shared rate limiter only pauses
+    once every key is cooling down.
+    """
+    if response.status_code == 429:
+        delay = parse_duration(response.headers.get("retry-after"), default=1.0)
+    else:
+        remaining = response.headers.get("x-ratelimit-remaining-requests")
+        if remaining is None or not remaining.isdigit() or int(remaining) > 0:
+            return
+        delay = parse_duration(response.headers.get("x-ratelimit-reset-requests"), default=1.0)
+    
+    now = time.monotonic()
+    _api_key_cooldown[api_key] = max(_api_key_cooldown.get(api_key, 0.0), now + delay)
+    
+    earliest = min(_api_key_cooldown.get(key, 0.0) for key in OPENAI_API_KEYS)
+    if earliest > now:
+        _rate_limiter.pause(earliest - now)
+
 
 def load_json_file(file_path: str) -> Optional[Dict]:
     """Load and parse a JSON file."""
     try:
+        if orjson is not None:
+            return orjson.loads(Path(file_path).read_bytes())
         with open(file_path, "r") as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError) as e:
@@ -48,14 +345,21 @@ def load_json_file(file_path: str) -> Optional[Dict]:
 
 
 def save_json_file(data: Dict, file_path: str) -> bool:
-    """Save data to a JSON file."""
+    """Save data to a JSON file.
+    
+    The file is written next to its destination and moved into place, so a
+    crash mid-write never leaves a truncated feed behind.
+    """
+    tmp_path = file_path + ".tmp"
     try:
-        directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            Path(tmp_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=2)
+        os.replace(tmp_path, file_path)
         
         logging.info(f"Successfully saved to {file_path}")
         return True
@@ -64,59 +368,272 @@ def save_json_file(data: Dict, file_path: str) -> bool:
         return False
 
 
-def call_openai_api(prompt: str, model: str = DEFAULT_MODEL) -> Optional[str]:
-    """Call the OpenAI API with a prompt and return the generated text."""
-    if not OPENAI_API_KEY:
-        logging.error("OpenAI API key not found. Set the OPENAI_API_KEY environment variable.")
-        return None
+def enable_llm_cache(path: str = DEFAULT_CACHE_PATH) -> LLMCache:
+    """Enable the on-disk LLM response cache for subsequent calls."""
+    global _llm_cache
+    _llm_cache = LLMCache(path)
+    return _llm_cache
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {OPENAI_API_KEY}"
-    }
+
+def enable_semantic_cache(path: str = DEFAULT_CACHE_PATH, threshold: float = 0.95) -> SemanticCache:
+    """Enable reuse of responses for prompts with near-identical embeddings."""
+    global _semantic_cache
+    _semantic_cache = SemanticCache(path, threshold)
+    return _semantic_cache
+
+
+def resolve_model(provider: str, model: str) -> str:
+    """Return the model a provider is actually called with; --model's OpenAI default maps to each provider's own."""
+    if model != DEFAULT_MODEL:
+        return model
+    if provider == "anthropic":
+        return DEFAULT_ANTHROPIC_MODEL
+    if provider == "local":
+        return LOCAL_LLM_MODEL
+    return model
+
+
+def set_llm_temperature(temperature: float) -> None:
+    """Set the sampling temperature for subsequent calls."""
+    global _temperature
+    _temperature = temperature
+
+
+def llm_temperature() -> float:
+    """Return the sampling temperature; cache keys include it, so responses at other temperatures are never reused."""
+    return _temperature
+
+
+def cached_llm_call(func):
+    """Short-circuit LLM calls whose (provider, model, prompt, temperature) was generated before.
+    
+    With the semantic cache enabled, a prompt ending in per-item details
+    reuses the response of an earlier prompt with the same instructions whose
+    details have a close enough embedding. Only the details are embedded, since
+    the shared instructions would make prompts for different items look alike.
+    """
+    @functools.wraps(func)
+    async def wrapper(client: httpx.AsyncClient, prompt: str, provider: str = "openai", model: str = DEFAULT_MODEL,
+                      json_keys: Optional[List[str]] = None, details: Optional[str] = None) -> Optional[str]:
+        # The local mock is free, so there is nothing worth caching
+        if (provider == "local" and not LOCAL_LLM_URL) or (_llm_cache is None and _semantic_cache is None):
+            return await func(client, prompt, provider, model, json_keys, details)
+        
+        temperature = llm_temperature()
+        resolved_model = resolve_model(provider, model)
+        key = LLMCache.make_key(provider, resolved_model, prompt, temperature)
+        if _llm_cache is not None:
+            cached = _llm_cache.get(key)
+            if cached is not None:
+                logging.debug("LLM cache hit")
+                return cached
+        
+        embedding = None
+        if _semantic_cache is not None and details and prompt.endswith(details):
+            # The instructions (field, or JSON keys requested) are part of the namespace
+            instructions = hashlib.sha256(prompt[:-len(details)].encode("utf-8")).hexdigest()[:16]
+            namespace = f"{provider}:{resolved_model}:{temperature}:{instructions}"
+            embedding = await embed_text(client, details)
+            if embedding is not None:
+                # The search scans every entry of the namespace, so keep it off the event loop
+                hit = await asyncio.to_thread(_semantic_cache.search, namespace, embedding)
+                if hit is not None:
+                    logging.debug(f"LLM semantic_hit (similarity {hit[0]:.3f})")
+                    return hit[1]
+        
+        result = await func(client, prompt, provider, model, json_keys, details)
+        if result is not None:
+            if _llm_cache is not None:
+                _llm_cache.set(key, result)
+            if embedding is not None:
+                _semantic_cache.add(namespace, embedding, result)
+        return result
+    
+    return wrapper
+
+
+async def call_openai_api(client: httpx.AsyncClient, prompt: str, model: str = DEFAULT_MODEL, json_mode: bool = False) -> Optional[str]:
+    """Call the OpenAI API with a prompt and return the generated text.
+    
+    The response is streamed, so content is assembled while the model is
+    still generating. With json_mode the model is constrained to return a
+    single JSON object.
+    """
+    if not OPENAI_API_KEYS:
+        logging.error("OpenAI API key not found. Set the OPENAI_API_KEY (or OPENAI_API_KEYS) environment variable.")
+        return None
     
     data = {
         "model": model,
         "messages": [
-            {"role": "system", "content": "You are a skilled food writer and marketer helping create engaging content for restaurants."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ],
-        "temperature": 0.7
+        "temperature": llm_temperature(),
+        "stream": True
     }
+    if json_mode:
+        data["response_format"] = {"type": "json_object"}
     
     try:
-        response = requests.post(OPENAI_API_URL, headers=headers, json=data)
-        response.raise_for_status()
-        result = response.json()
+        # The payload is identical on every attempt, so serialize it only once
+        body = json_dumps(data)
+        for attempt in range(MAX_REQUEST_RETRIES + 1):
+            await _rate_limiter.acquire()
+            api_key = next_api_key()
+            headers = {**JSON_HEADERS, "Authorization": f"Bearer {api_key}"}
+            async with client.stream("POST", OPENAI_API_URL, headers=headers, content=body) as response:
+                observe_rate_limit(response, api_key)
+                retryable = response.status_code == 429 or (response.status_code >= 500 and attempt < MAX_REQUEST_RETRIES)
+                if not retryable:
+                    if response.is_error:
+                        await response.aread()
+                        response.raise_for_status()
+                    return await read_streamed_content(response)
+            
+            if response.status_code == 429:
+                logging.warning(f"OpenAI rate limit hit (attempt {attempt + 1}), backing off")
+            else:
+                logging.warning(f"OpenAI server error {response.status_code} (attempt {attempt + 1}), retrying")
+                await asyncio.sleep(2 ** attempt + random.random())
         
-        if "choices" in result and len(result["choices"]) > 0:
-            return result["choices"][0]["message"]["content"].strip()
-        else:
-            logging.error(f"Unexpected API response structure: {result}")
-            return None
+        # Still rate limited after the last retry
+        response.raise_for_status()
     except Exception as e:
         logging.error(f"Error calling OpenAI API: {e}")
         return None
 
 
-def call_llm_api(prompt: str, provider: str = "openai", model: str = DEFAULT_MODEL) -> Optional[str]:
-    """Call an LLM API based on the provider and return the generated text."""
-    if provider == "openai":
-        return call_openai_api(prompt, model)
-    elif provider == "anthropic":
-        # Integration with Anthropic Claude would go here
-        logging.error("Anthropic API not yet implemented. Please use 'openai' provider.")
+async def call_anthropic_api(prompt: str, model: str = DEFAULT_ANTHROPIC_MODEL) -> Optional[str]:
+    """Call the Anthropic Messages API with a prompt and return the generated text.
+    
+    The system prompt is marked for prompt caching, since it is identical for
+    every request in a run.
+    """
+    global _anthropic_client
+    if AsyncAnthropic is None:
+        logging.error("The anthropic package is required for the anthropic provider. Install it with 'pip install anthropic'.")
         return None
-    elif provider == "local":
-        # Example of a mock local LLM for testing without API keys
-        logging.warning("Using local mock LLM (for testing only)")
-        return f"[LOCAL LLM MOCK] Generated content based on: {prompt[:50]}..."
-    else:
-        logging.error(f"Unsupported LLM provider: {provider}")
+    if not ANTHROPIC_API_KEY:
+        logging.error("Anthropic API key not found. Set the ANTHROPIC_API_KEY environment variable.")
+        return None
+    
+    if _anthropic_client is None:
+        _anthropic_client = AsyncAnthropic(api_key=ANTHROPIC_API_KEY, max_retries=MAX_REQUEST_RETRIES)
+    
+    try:
+        message = await _anthropic_client.messages.create(
+            model=model,
+            max_tokens=ANTHROPIC_MAX_TOKENS,
+            temperature=llm_temperature(),
+            system=[{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return "".join(block.text for block in message.content if block.type == "text").strip()
+    except Exception as e:
+        logging.error(f"Error calling Anthropic API: {e}")
+        return None
+
+
+async def call_local_api(client: httpx.AsyncClient, prompt: str, model: str = LOCAL_LLM_MODEL, json_mode: bool = False) -> Optional[str]:
+    """Call the OpenAI-compatible server at LOCAL_LLM_URL and return the generated text."""
+    data = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": llm_temperature()
+    }
+    if json_mode:
+        data["response_format"] = {"type": "json_object"}
+    
+    try:
+        response = await client.post(LOCAL_LLM_URL, headers=JSON_HEADERS, content=json_dumps(data))
+        response.raise_for_status()
+        return json_loads(response.content)["choices"][0]["message"]["content"].strip()
+    except Exception as e:
+        logging.error(f"Error calling local LLM at {LOCAL_LLM_URL}: {e}")
+        return None
+
+
+async def read_streamed_content(response: httpx.Response) -> Optional[str]:
+    """Assemble the message content from an OpenAI server-sent event stream."""
+    parts = []
+    saw_choice = False
+    async for line in response.aiter_lines():
+        if not line.startswith("data: "):
+            continue
+        payload = line[6:]
+        if payload == "[DONE]":
+            break
+        
+        choices = json_loads(payload).get("choices")
+        if choices:
+            saw_choice = True
+            parts.append(choices[0].get("delta", {}).get("content") or "")
+    
+    if not saw_choice:
+        logging.error("Unexpected API response: stream contained no choices")
+        return None
+    return "".join(parts).strip()
+
+
+async def embed_text(client: httpx.AsyncClient, text: str) -> Optional[List[float]]:
+    """Embed text with the OpenAI embeddings API, or return None if that is not possible."""
+    if not OPENAI_API_KEYS:
         return None
+    
+    headers = {**JSON_HEADERS, "Authorization": f"Bearer {next_api_key()}"}
+    try:
+        await _rate_limiter.acquire()
+        response = await client.post(OPENAI_EMBEDDINGS_URL, headers=headers,
+                                     content=json_dumps({"model": EMBEDDING_MODEL, "input": text}))
+        response.raise_for_status()
+        return json_loads(response.content)["data"][0]["embedding"]
+    except Exception as e:
+        logging.warning(f"Could not embed prompt for the semantic cache: {e}")
+        return None
+
+
+@cached_llm_call
+async def call_llm_api(client: httpx.AsyncClient, prompt: str, provider: str = "openai", model: str = DEFAULT_MODEL,
+                       json_keys: Optional[List[str]] = None, details: Optional[str] = None) -> Optional[str]:
+    """Call an LLM API based on the provider and return the generated text.
+    
+    At most LLM_CONCURRENCY calls are in flight at any time, so callers can
+    safely gather every prompt for a feed at once. When json_keys is given the
+    response is requested as a JSON object with those keys. details, the
+    per-item tail of the prompt, is only used by the semantic cache.
+    """
+    async with _llm_semaphore:
+        if provider == "openai":
+            return await call_openai_api(client, prompt, model, json_mode=json_keys is not None)
+        elif provider == "anthropic":
+            return await call_anthropic_api(prompt, resolve_model(provider, model))
+        elif provider == "local" and LOCAL_LLM_URL:
+            return await call_local_api(client, prompt, resolve_model(provider, model), json_mode=json_keys is not None)
+        elif provider == "local":
+            # Example of a mock local LLM for testing without API keys
+            logging.warning("Using local mock LLM (for testing only)")
+            mock = f"[LOCAL LLM MOCK] Generated content based on: {prompt[:50]}..."
+            if json_keys is not None:
+                return json.dumps({key: mock for key in json_keys})
+            return mock
+        else:
+            logging.error(f"Unsupported LLM provider: {provider}")
+            return None
 
 
-def generate_dish_narrative(dish: Dict, field: str, provider: str = "openai", model: str = DEFAULT_MODEL) -> Optional[Dict]:
+def dish_prompt_details(dish: Dict) -> str:
+    """Format the per-dish details that end every dish prompt."""
+    details = f"Dish: {dish.get('name', '')}"
+    if dish.get("description"):
+        details += f"\nDescription: {dish['description']}"
+    return details
+
+
+async def generate_dish_narrative(client: httpx.AsyncClient, dish: Dict, field: str, provider: str = "openai", model: str = DEFAULT_MODEL) -> Optional[Dict]:
     """Generate narrative content for a specified dish field using LLM."""
     dish_name = dish.get("name", "")
     dish_description = dish.get("description", "")
@@ -125,21 +642,8 @@ def generate_dish_narrative(dish: Dict, field: str, provider: str = "openai", mo
         logging.error("Dish must have a name for narrative generation")
         return None
     
-    # Define field-specific prompts if no template is available
-    default_prompts = {
-        "chef_story": f"Write a compelling chef's story (100-150 words) for the dish '{dish_name}'. Include details about the inspiration, culinary journey, and passion behind creating this dish.",
-        
-        "chef_highlight": f"Write a brief highlight (30-50 words) about the chef's special connection to the dish '{dish_name}'.",
-        
-        "seasonal_story": f"Write a seasonal story (100-150 words) for the dish '{dish_name}', explaining how it connects to the current season, ingredients availability, and traditions.",
-        
-        "cultural_context": f"Write about the cultural context (100-150 words) of the dish '{dish_name}'. Include its origins, significance in its culture, and how it has evolved.",
-        
-        "ingredient_story": f"Write a story (100-150 words) about the key ingredients in the dish '{dish_name}'. Focus on sourcing, quality, and what makes these ingredients special."
-    }
-    
     # Check if the field exists and we have a template for it
-    if field not in default_prompts and (field not in dish or "suggested_prompt_template" not in dish):
+    if field not in _DISH_PROMPTS and (field not in dish or "suggested_prompt_template" not in dish):
         logging.error(f"No template available for field '{field}'")
         return None
     
@@ -147,24 +651,27 @@ def generate_dish_narrative(dish: Dict, field: str, provider: str = "openai", mo
     if "suggested_prompt_template" in dish:
         prompt_template = dish["suggested_prompt_template"]
         # Gather variables for the template
-        template_vars = {
-            "dish_name": dish_name,
-            "length": "150 words",
-            "key_ingredient": "its key ingredients"  # Default value
-        }
+        template_vars = _TemplateVars(
+            dish_name=dish_name,
+            length="150 words",
+            key_ingredient="its key ingredients"  # Default value
+        )
         
         # Extract key_ingredient from description if possible
-        if dish_description and "with" in dish_description:
-            ingredients_part = dish_description.split("with", 1)[1].strip()
-            template_vars["key_ingredient"] = ingredients_part
+        parts = _WITH_RE.split(dish_description, maxsplit=1) if dish_description else []
+        if len(parts) == 2 and parts[1].strip():
+            template_vars["key_ingredient"] = parts[1].strip()
         
-        prompt = prompt_template.format(**template_vars)
+        prompt = prompt_template.format_map(template_vars)
+        details = None
     else:
         # Fall back to default prompts
-        prompt = default_prompts.get(field, f"Write content for {field} field for the dish '{dish_name}'.")
+        template = _DISH_PROMPTS.get(field, _DISH_FALLBACK_PROMPT)
+        details = dish_prompt_details(dish)
+        prompt = template.format_map(_TemplateVars(field=field, details=details))
     
     # Call the LLM API
-    generated_text = call_llm_api(prompt, provider, model)
+    generated_text = await call_llm_api(client, prompt, provider, model, details=details)
     
     if not generated_text:
         return None
@@ -177,7 +684,54 @@ def generate_dish_narrative(dish: Dict, field: str, provider: str = "openai", mo
     }
 
 
-def generate_restaurant_content(restaurant: Dict, field: str, provider: str = "openai", model: str = DEFAULT_MODEL) -> Optional[str]:
+async def generate_dish_all_narratives(client: httpx.AsyncClient, dish: Dict, fields: List[str], provider: str = "openai", model: str = DEFAULT_MODEL) -> Dict[str, Dict]:
+    """Generate several narrative fields for a dish with a single LLM request.
+    
+    The model is asked for a JSON object keyed by field name. Fields missing
+    from the response, and dishes with their own suggested_prompt_template,
+    fall back to one request per field.
+    """
+    dish_name = dish.get("name", "")
+    per_field = list(fields)
+    generated = {}
+    
+    if dish_name and "suggested_prompt_template" not in dish and all(field in NARRATIVE_FIELD_GUIDES for field in fields):
+        field_lines = "\n".join(f"- {field}: {NARRATIVE_FIELD_GUIDES[field]}" for field in fields)
+        details = dish_prompt_details(dish)
+        prompt = (
+            "Write the following narrative content for the dish below. "
+            f"Return a JSON object with exactly these keys, each a string:\n{field_lines}\n\n"
+            f"{details}"
+        )
+        
+        text = await call_llm_api(client, prompt, provider, model, json_keys=list(fields), details=details)
+        if text:
+            try:
+                parsed = json_loads(text)
+            except ValueError as e:
+                logging.warning(f"Could not parse batched narrative response for {dish_name}: {e}")
+                parsed = {}
+            
+            if isinstance(parsed, dict):
+                for field in fields:
+                    value = parsed.get(field)
+                    if isinstance(value, str) and value.strip():
+                        generated[field] = {"translations": {"en": value.strip()}}
+        
+        per_field = [field for field in fields if field not in generated]
+    
+    if per_field:
+        results = await asyncio.gather(*[
+            generate_dish_narrative(client, dish, field, provider, model) for field in per_field
+        ])
+        for field, content in zip(per_field, results):
+            if content:
+                generated[field] = content
+    
+    return generated
+
+
+async def generate_restaurant_content(client: httpx.AsyncClient, restaurant: Dict, field: str, provider: str = "openai", model: str = DEFAULT_MODEL) -> Optional[str]:
     """Generate marketing content for a restaurant field using LLM."""
     restaurant_name = restaurant.get("name", "")
     
@@ -189,17 +743,8 @@ def generate_restaurant_content(restaurant: Dict, field: str, provider: str = "o
     key_message_points = restaurant.get("key_message_points", [])
     key_points_text = ", ".join(key_message_points) if key_message_points else "quality, authentic cuisine"
     
-    # Define field-specific prompts
-    default_prompts = {
-        "description": f"Write an engaging description (100-150 words) for {restaurant_name}. Emphasize these key points: {key_points_text}.",
-        
-        "social_media_blurb": f"Write a catchy social media bio (50-60 words) for {restaurant_name} that would work on Instagram or Facebook. Emphasize: {key_points_text}.",
-        
-        "loyalty_program_promo": f"Write a promotional blurb (30-40 words) for {restaurant_name}'s loyalty program that encourages customers to sign up. Emphasize: {key_points_text}."
-    }
-    
     # Check if we have a template for this field
-    if field not in default_prompts and "suggested_prompt_template" not in restaurant:
+    if field not in _RESTAURANT_PROMPTS and "suggested_prompt_template" not in restaurant:
         logging.error(f"No template available for field '{field}'")
         return None
     
@@ -207,34 +752,50 @@ def generate_restaurant_content(restaurant: Dict, field: str, provider: str = "o
     if "suggested_prompt_template" in restaurant:
         prompt_template = restaurant["suggested_prompt_template"]
         # Gather variables for the template
-        template_vars = {
-            "restaurant_name": restaurant_name,
-            "key_message_points": key_points_text,
-            "length": "150 words"
-        }
+        template_vars = _TemplateVars(
+            restaurant_name=restaurant_name,
+            key_message_points=key_points_text,
+            length="150 words"
+        )
         
-        prompt = prompt_template.format(**template_vars)
+        prompt = prompt_template.format_map(template_vars)
+        details = None
     else:
         # Fall back to default prompts
-        prompt = default_prompts.get(field, f"Write content for {field} field for {restaurant_name}.")
+        template = _RESTAURANT_PROMPTS.get(field, _RESTAURANT_FALLBACK_PROMPT)
+        details = f"Restaurant: {restaurant_name}\nKey points: {key_points_text}"
+        prompt = template.format_map(_TemplateVars(field=field, details=details))
     
     # Call the LLM API
-    return call_llm_api(prompt, provider, model)
+    return await call_llm_api(client, prompt, provider, model, details=details)
+
 
+def missing_fields(dish: Dict, fields: Tuple[str, ...]) -> List[str]:
+    """Return the fields of a dish that have no English content yet."""
+    missing = []
+    for field in fields:
+        value = dish.get(field)
+        if isinstance(value, dict):
+            value = value.get("translations", {}).get("en")
+        if not value:
+            missing.append(field)
+    return missing
 
-def update_dish_narratives(feed: Dict, dish_id: Optional[str] = None, provider: str = "openai", model: str = DEFAULT_MODEL) -> Dict:
-    """Update narrative fields for one or all dishes in a feed using LLM."""
+
+async def update_dish_narratives(client: httpx.AsyncClient, feed: Dict, dish_id: Optional[str] = None, provider: str = "openai", model: str = DEFAULT_MODEL,
+                                 checkpoint: Optional[CheckpointLog] = None) -> Dict:
+    """Update narrative fields for one or all dishes in a feed using LLM.
+    
+    The feed is updated in place and returned. With a checkpoint, each dish's
+    generated fields are logged as soon as the dish completes.
+    """
     if "dishes" not in feed:
         logging.error("No dishes found in feed")
         return feed
     
-    updated_feed = feed.copy()
-    
-    # Fields to generate content for
-    narrative_fields = ["chef_story", "seasonal_story", "cultural_context", "ingredient_story", "chef_highlight"]
-    
-    # Process each dish or just the specified one
-    for i, dish in enumerate(updated_feed["dishes"]):
+    # Collect the missing fields of every dish before calling the LLM
+    jobs = []
+    for i, dish in enumerate(feed["dishes"]):
         current_dish_id = dish.get("id")
         
         # Skip if we're targeting a specific dish and this isn't it
@@ -244,38 +805,46 @@ def update_dish_narratives(feed: Dict, dish_id: Optional[str] = None, provider:
         dish_name = dish.get("name", f"Dish {i+1}")
         logging.info(f"Generating narrative content for dish: {dish_name}")
         
-        # Generate content for each narrative field
-        for field in narrative_fields:
-            # Skip if the field already has content
-            if field in dish and dish[field].get("translations", {}).get("en"):
-                logging.info(f"  Field '{field}' already has content, skipping...")
-                continue
-                
-            logging.info(f"  Generating content for field: {field}")
-            content = generate_dish_narrative(dish, field, provider, model)
-            
-            if content:
-                dish[field] = content
-                logging.info(f"  Content generated for {field}")
+        # Skip fields that already have content
+        missing = missing_fields(dish, NARRATIVE_FIELDS)
+        if len(missing) < len(NARRATIVE_FIELDS):
+            logging.info(f"  {len(NARRATIVE_FIELDS) - len(missing)} field(s) already have content, skipping them")
+        
+        if missing:
+            jobs.append((dish, missing))
+    
+    async def update_dish(dish: Dict, fields: List[str]) -> None:
+        generated = await generate_dish_all_narratives(client, dish, fields, provider, model)
+        
+        dish_name = dish.get("name", dish.get("id"))
+        for field in fields:
+            if field in generated:
+                dish[field] = generated[field]
+                logging.info(f"  Content generated for {field} ({dish_name})")
             else:
-                logging.warning(f"  Failed to generate content for {field}")
-            
-            # Add a small delay to avoid rate limits
-            time.sleep(1)
+                logging.warning(f"  Failed to generate content for {field} ({dish_name})")
+        
+        if checkpoint is not None and generated and dish.get("id"):
+            checkpoint.record(dish["id"], generated)
     
-    return updated_feed
+    # Generate content for all dishes concurrently, one request per dish
+    await asyncio.gather(*[update_dish(dish, fields) for dish, fields in jobs])
+    
+    return feed
 
 
-def update_restaurant_marketing(feed: Dict, restaurant_id: Optional[str] = None, provider: str = "openai", model: str = DEFAULT_MODEL) -> Dict:
-    """Update marketing content for one or all restaurants in a feed using LLM."""
+async def update_restaurant_marketing(client: httpx.AsyncClient, feed: Dict, restaurant_id: Optional[str] = None, provider: str = "openai", model: str = DEFAULT_MODEL) -> Dict:
+    """Update marketing content for one or all restaurants in a feed using LLM.
+    
+    The feed is updated in place and returned.
+    """
     if "restaurants" not in feed:
         logging.error("No restaurants found in feed")
         return feed
     
-    updated_feed = feed.copy()
-    
-    # Process each restaurant or just the specified one
-    for restaurant in updated_feed["restaurants"]:
+    # Collect (restaurant, field, target dict, target key) for every missing piece of content
+    jobs = []
+    for restaurant in feed["restaurants"]:
         current_restaurant_id = restaurant.get("id")
         
         # Skip if we're targeting a specific restaurant and this isn't it
@@ -288,11 +857,7 @@ def update_restaurant_marketing(feed: Dict, restaurant_id: Optional[str] = None,
         # Update restaurant description if empty
         if not restaurant.get("description"):
             logging.info("  Generating restaurant description")
-            description = generate_restaurant_content(restaurant, "description", provider, model)
-            if description:
-                restaurant["description"] = description
-                logging.info("  Description generated")
-            time.sleep(1)
+            jobs.append((restaurant, "description", restaurant, "description"))
         
         # Ensure marketing_extension exists
         if "marketing_extension" not in restaurant:
@@ -307,19 +872,7 @@ def update_restaurant_marketing(feed: Dict, restaurant_id: Optional[str] = None,
         social = marketing["social_media_strategy"]
         if not social.get("social_media_blurb"):
             logging.info("  Generating social media blurb")
-            blurb = generate_restaurant_content(restaurant, "social_media_blurb", provider, model)
-            if blurb:
-                social["social_media_blurb"] = blurb
-                
-                # Add default platforms and hashtags if not present
-                if "platforms" not in social:
-                    social["platforms"] = ["Instagram", "Facebook"]
-                
-                if "hashtags" not in social:
-                    social["hashtags"] = ["#LocalFood", "#FarmToTable"]
-                
-                logging.info("  Social media blurb generated")
-            time.sleep(1)
+            jobs.append((restaurant, "social_media_blurb", social, "social_media_blurb"))
         
         # Update loyalty program
         if "loyalty_program" not in marketing:
@@ -336,13 +889,134 @@ def update_restaurant_marketing(feed: Dict, restaurant_id: Optional[str] = None,
         loyalty = marketing["loyalty_program"]
         if not loyalty.get("promo_blurb"):
             logging.info("  Generating loyalty program promo")
-            promo = generate_restaurant_content(restaurant, "loyalty_program_promo", provider, model)
-            if promo:
-                loyalty["promo_blurb"] = promo
-                logging.info("  Loyalty program promo generated")
-            time.sleep(1)
+            jobs.append((restaurant, "loyalty_program_promo", loyalty, "promo_blurb"))
+    
+    # Generate content for all restaurants concurrently
+    results = await asyncio.gather(*[
+        generate_restaurant_content(client, restaurant, field, provider, model) for restaurant, field, _, _ in jobs
+    ])
+    
+    for (restaurant, field, target, key), content in zip(jobs, results):
+        if not content:
+            continue
+        
+        target[key] = content
+        
+        if field == "social_media_blurb":
+            # Add default platforms and hashtags if not present
+            if "platforms" not in target:
+                target["platforms"] = ["Instagram", "Facebook"]
+            
+            if "hashtags" not in target:
+                target["hashtags"] = ["#LocalFood", "#FarmToTable"]
+        
+        logging.info(f"  Generated {field} for {restaurant.get('name', 'Restaurant')}")
+    
+    return feed
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client used for all LLM requests.
+    
+    Connections are kept alive and pooled so TLS handshakes are paid once per
+    connection rather than once per prompt. HTTP/2 is used when the optional
+    h2 package is installed.
+    """
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    
+    # Transport retries cover connection failures only, not HTTP error statuses
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        retries=3
+    )
+    return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(60.0, connect=5.0))
+
+
+async def warm_up_connection(client: httpx.AsyncClient, provider: str) -> None:
+    """Open a connection to the provider so the TLS handshake overlaps with feed loading."""
+    if provider != "openai" or not OPENAI_API_KEYS:
+        return
     
-    return updated_feed
+    try:
+        await client.get(OPENAI_MODELS_URL, headers={"Authorization": f"Bearer {OPENAI_API_KEYS[0]}"})
+    except httpx.HTTPError as e:
+        logging.debug(f"Connection warm-up failed: {e}")
+
+
+async def generate_content(feed: Dict, args: argparse.Namespace, client: httpx.AsyncClient, checkpoint: Optional[CheckpointLog] = None) -> Dict:
+    """Generate LLM content for the feed according to the command-line arguments."""
+    if args.dish_id:
+        logging.info(f"Generating narrative content for dish ID: {args.dish_id}")
+        return await update_dish_narratives(client, feed, args.dish_id, args.provider, args.model, checkpoint)
+    elif args.restaurant_id:
+        logging.info(f"Generating marketing content for restaurant ID: {args.restaurant_id}")
+        return await update_restaurant_marketing(client, feed, args.restaurant_id, args.provider, args.model)
+    else:
+        logging.info("Generating content for all restaurants and dishes")
+        # Restaurant and dish fields are disjoint, so both phases share the client and rate limits concurrently
+        await asyncio.gather(
+            update_restaurant_marketing(client, feed, None, args.provider, args.model),
+            update_dish_narratives(client, feed, None, args.provider, args.model, checkpoint)
+        )
+        return feed
+
+
+def restore_checkpoint(feed: Dict, checkpoint: CheckpointLog) -> None:
+    """Fill in dish fields that are still empty with content generated by an interrupted earlier run."""
+    restored = checkpoint.load()
+    if not restored:
+        return
+    
+    logging.info(f"Restoring generated content for {len(restored)} dish(es) from {checkpoint.path}")
+    for dish in feed.get("dishes", []):
+        updates = restored.get(dish.get("id"))
+        if updates:
+            # Content already in the input feed always wins over the log
+            for field in missing_fields(dish, NARRATIVE_FIELDS):
+                if field in updates:
+                    dish[field] = updates[field]
+
+
+async def enhance_feed(args: argparse.Namespace, output_file: str) -> bool:
+    """Load the input feed, generate LLM content for it and save the result.
+    
+    Parsing the feed runs in a worker thread while the provider connection is
+    warmed up, so neither waits on the other. Dish content is checkpointed
+    next to the output file until the enhanced feed has been saved.
+    """
+    async with create_http_client() as client:
+        feed, _ = await asyncio.gather(
+            asyncio.to_thread(load_json_file, args.input),
+            warm_up_connection(client, args.provider)
+        )
+        if not feed:
+            return False
+        
+        # Check if feed is ORFS v1.1
+        version = feed.get("header", {}).get("version", "1.0")
+        if version != "1.1":
+            logging.warning(f"This script is designed for ORFS v1.1, detected version: {version}")
+            
+            # Update the version
+            if "header" not in feed:
+                feed["header"] = {}
+            feed["header"]["version"] = "1.1"
+        
+        run = {"provider": args.provider, "model": resolve_model(args.provider, args.model)}
+        checkpoint = CheckpointLog(output_file + CHECKPOINT_SUFFIX, run)
+        restore_checkpoint(feed, checkpoint)
+        
+        updated_feed = await generate_content(feed, args, client, checkpoint)
+    
+    success = save_json_file(updated_feed, output_file)
+    if success:
+        checkpoint.remove()
+    return success
 
 
 def main():
@@ -354,6 +1028,17 @@ def main():
     parser.add_argument('--provider', choices=SUPPORTED_PROVIDERS, default="local", 
                         help='LLM provider to use (default: local - for testing without API)')
     parser.add_argument('--model', default=DEFAULT_MODEL, help='Model name for the LLM provider')
+    parser.add_argument('--cache', action='store_true', default=os.environ.get("LLM_CACHE") == "1",
+                        help='Cache LLM responses on disk and reuse them across runs (default: LLM_CACHE=1)')
+    parser.add_argument('--cache-path', default=DEFAULT_CACHE_PATH, help='SQLite file for the LLM response cache')
+    parser.add_argument('--temperature', type=float, default=DEFAULT_TEMPERATURE,
+                        help=f'Sampling temperature (default: {DEFAULT_TEMPERATURE}). Use 0 for deterministic output; '
+                             'cached responses are only reused at the same temperature')
+    parser.add_argument('--semantic-cache', action='store_true',
+                        help='Reuse responses of earlier prompts with near-identical embeddings (needs an OpenAI key). '
+                             'Very similar dishes may share generated content.')
+    parser.add_argument('--semantic-threshold', type=float, default=0.95,
+                        help='Minimum cosine similarity for a semantic cache hit (default: 0.95)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
     
     args = parser.parse_args()
@@ -362,51 +1047,35 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Check for API key if using a cloud provider
-    if args.provider == "openai" and not OPENAI_API_KEY:
-        logging.error("OpenAI API key not found. Set the OPENAI_API_KEY environment variable.")
+    if args.provider == "openai" and not OPENAI_API_KEYS:
+        logging.error("OpenAI API key not found. Set the OPENAI_API_KEY (or OPENAI_API_KEYS) environment variable.")
         logging.info("For testing without an API key, use --provider=local")
         sys.exit(1)
-    
-    # Load the feed
-    feed = load_json_file(args.input)
-    if not feed:
+    if args.provider == "anthropic" and not ANTHROPIC_API_KEY:
+        logging.error("Anthropic API key not found. Set the ANTHROPIC_API_KEY environment variable.")
+        logging.info("For testing without an API key, use --provider=local")
         sys.exit(1)
     
-    # Check if feed is ORFS v1.1
-    version = feed.get("header", {}).get("version", "1.0")
-    if version != "1.1":
-        logging.warning(f"This script is designed for ORFS v1.1, detected version: {version}")
-        
-        # Update the version
-        if "header" not in feed:
-            feed["header"] = {}
-        feed["header"]["version"] = "1.1"
+    set_llm_temperature(args.temperature)
+    if args.cache:
+        enable_llm_cache(args.cache_path)
+    semantic_cache = enable_semantic_cache(args.cache_path, args.semantic_threshold) if args.semantic_cache else None
     
-    # Generate content
-    if args.dish_id:
-        logging.info(f"Generating narrative content for dish ID: {args.dish_id}")
-        updated_feed = update_dish_narratives(feed, args.dish_id, args.provider, args.model)
-    elif args.restaurant_id:
-        logging.info(f"Generating marketing content for restaurant ID: {args.restaurant_id}")
-        updated_feed = update_restaurant_marketing(feed, args.restaurant_id, args.provider, args.model)
-    else:
-        logging.info("Generating content for all restaurants and dishes")
-        # First update restaurants, then dishes
-        temp_feed = update_restaurant_marketing(feed, None, args.provider, args.model)
-        updated_feed = update_dish_narratives(temp_feed, None, args.provider, args.model)
-    
-    # Save the output
+    # Work out where the enhanced feed goes
     if args.output:
         output_file = args.output
     else:
         input_base = os.path.splitext(args.input)[0]
         output_file = f"{input_base}_enhanced.json"
     
-    success = save_json_file(updated_feed, output_file)
+    # Load the feed, generate content and save the output
+    success = asyncio.run(enhance_feed(args, output_file))
+    if semantic_cache is not None:
+        semantic_cache.close()
     
     if success:
         logging.info(f"Enhanced feed saved to: {output_file}")
-        if args.provider == "local":
+        if args.provider == "local" and not LOCAL_LLM_URL:
             logging.info("Note: Content was generated with the local mock provider. For real content, use --provider=openai with an API key.")
     
     sys.exit(0 if success else 1)
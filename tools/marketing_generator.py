@@ -7,25 +7,35 @@ It creates starter templates based on restaurant and dish information.
 
 Usage:
   python marketing_generator.py --create-templates path/to/basic_feed.json --output path/to/output_dir
+  python marketing_generator.py --create-templates feed1.json feed2.json --output path/to/output_dir
   python marketing_generator.py --enhance-field chef_story --input path/to/feed.json --dish-id dish123
   python marketing_generator.py --generate-bundle-promotion --input path/to/feed.json
 """
 
 import argparse
+import asyncio
+import copy
+import functools
 import json
 import os
+import string
 import sys
 import logging
 import textwrap
-from datetime import datetime, timedelta
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Logging is configured in main(), so importing this module has no side effects
+logger = logging.getLogger(__name__)
 
 # Template definitions for narrative fields
 NARRATIVE_TEMPLATES = {
@@ -117,6 +127,21 @@ MARKETING_EXTENSION_TEMPLATE = {
     }
 }
 
+# How long generated promotional offers run
+PROMOTION_DAYS = 30
+
+# Season for each month, indexed by month number - 1
+_SEASONS = (
+    "winter", "winter", "spring", "spring", "spring", "summer",
+    "summer", "summer", "fall", "fall", "fall", "winter"
+)
+
+# Dish types a bundle tries to include one of, in order, matched against dish categories
+BUNDLE_DISH_TYPES = ("appetizer", "main", "dessert")
+
+# Discount applied to the summed price of a bundle's items
+BUNDLE_DISCOUNT = 0.15
+
 # Bundle template
 BUNDLE_TEMPLATE = {
     "id": "{restaurant_id}_{bundle_name}",
@@ -132,27 +157,93 @@ BUNDLE_TEMPLATE = {
 def load_json_file(file_path: str) -> Optional[Dict]:
     """Load and parse a JSON file."""
     try:
+        if orjson is not None:
+            return orjson.loads(Path(file_path).read_bytes())
         with open(file_path, "r") as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError) as e:
-        logging.error(f"Could not load file {file_path}: {e}")
+        logger.error(f"Could not load file {file_path}: {e}")
         return None
 
 
+def _dumps_indented(value: Any) -> bytes:
+    """Serialize a value as JSON with 2-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode("utf-8")
+
+
+class StreamingJSONWriter:
+    """Write a JSON object to a file one member at a time.
+    
+    Arrays can be written from any iterable, so only one item needs to be
+    serialized at a time instead of the whole document. The output is
+    identical to serializing the complete object with 2-space indentation.
+    """
+    
+    def __init__(self, file_path: str):
+        self._file = open(file_path, "wb", buffering=1 << 20)
+        self._members = 0
+    
+    def __enter__(self) -> "StreamingJSONWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            # Leave the incomplete document unterminated rather than looking valid
+            self._file.close()
+        self.close()
+    
+    def write(self, key: str, value: Any) -> None:
+        """Write a member whose value is serialized in one piece."""
+        self._write_key(key)
+        self._file.write(_dumps_indented(value).replace(b"\n", b"\n  "))
+    
+    def write_items(self, key: str, items: Iterable) -> None:
+        """Write an array member, serializing its items one by one."""
+        self._write_key(key)
+        self._file.write(b"[")
+        count = 0
+        for item in items:
+            self._file.write(b",\n    " if count else b"\n    ")
+            self._file.write(_dumps_indented(item).replace(b"\n", b"\n    "))
+            count += 1
+        self._file.write(b"\n  ]" if count else b"]")
+    
+    def close(self) -> None:
+        """Finish the object and close the file."""
+        if self._file.closed:
+            return
+        self._file.write(b"\n}" if self._members else b"{}")
+        self._file.close()
+    
+    def _write_key(self, key: str) -> None:
+        self._file.write(b",\n  " if self._members else b"{\n  ")
+        self._file.write(_dumps_indented(key) + b": ")
+        self._members += 1
+
+
 def save_json_file(data: Dict, file_path: str) -> bool:
-    """Save data to a JSON file."""
+    """Save data to a JSON file.
+    
+    Top-level arrays (restaurants, dishes, bundles, ...) are written item by
+    item, so the serialized feed is never held in memory all at once.
+    """
     try:
-        directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        # exist_ok, since batch saves can create the same directory concurrently
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        with StreamingJSONWriter(file_path) as writer:
+            for key, value in data.items():
+                if isinstance(value, list):
+                    writer.write_items(key, value)
+                else:
+                    writer.write(key, value)
         
-        logging.info(f"Successfully saved to {file_path}")
+        logger.info(f"Successfully saved to {file_path}")
         return True
     except Exception as e:
-        logging.error(f"Failed to save to {file_path}: {e}")
+        logger.error(f"Failed to save to {file_path}: {e}")
         return False
 
 
@@ -163,6 +254,42 @@ def clean_format_string(text: str) -> str:
     return ' '.join(cleaned_lines)
 
 
+def compile_template(template: str):
+    """Compile a format string into a function that renders it from a mapping.
+    
+    render(values) returns the same text as template.format_map(values), but
+    the format string is parsed once up front and rendering is a single join.
+    Templates using attribute/index lookups or nested format specs fall back
+    to format_map.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+        if field is None:
+            continue
+        if not field.isidentifier() or "{" in spec:
+            return template.format_map
+        
+        value = f"values[{field!r}]"
+        if conversion:
+            value = f"{_CONVERSIONS[conversion]}({value})"
+        parts.append(f"format({value}, {spec!r})")
+    
+    body = f"''.join(({', '.join(parts)},))" if parts else "''"
+    source = f"def render(values):\n    return {body}\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["render"]
+
+
+_CONVERSIONS = {"s": "str", "r": "repr", "a": "ascii"}
+
+# Narrative templates are constant, so clean and compile them once rather than for every dish
+_CLEANED_NARRATIVE_TEMPLATES = {field: clean_format_string(template) for field, template in NARRATIVE_TEMPLATES.items()}
+_NARRATIVE_RENDERERS = {field: compile_template(template) for field, template in _CLEANED_NARRATIVE_TEMPLATES.items()}
+
+
 def create_translated_string(text: str, languages: List[str] = ["en"]) -> Dict:
     """Create a TranslatedString object with the given text in specified languages."""
     translations = {}
@@ -174,49 +301,47 @@ def create_translated_string(text: str, languages: List[str] = ["en"]) -> Dict:
     }
 
 
+# Placeholder values shared by every dish's narrative templates
+_BASE_TEMPLATE_VARS = {
+    "dish_adjective": "exquisite",
+    "chef_name": "Alex",
+    "pronoun": "they",
+    "key_ingredient": "locally-sourced ingredients",
+    "secondary_ingredient": "seasonal herbs",
+    "location": "Southern France",
+    "cuisine_type": "Mediterranean",
+    "event": "a summer festival",
+    "philosophy_point": "respecting ingredients and traditions",
+    "commitment_point": "sustainability and supporting local farmers",
+    "season_name": "Summer",
+    "farm_name": "Green Valley Farm",
+    "farm_distance": "15",
+    "method": "slow-cooking",
+    "quality": "freshness",
+    "culture": "Mediterranean",
+    "occasion": "harvest celebrations",
+    "cultural_significance": "community and sharing",
+    "supplier_name": "Green Valley Farm",
+    "supplier_location": "the local countryside",
+    "years": "three generations",
+    "farming_method": "traditional organic",
+    "certification": "sustainable"
+}
+
+
 def generate_dish_templates(dish: Dict, restaurant: Dict) -> Dict:
     """Generate narrative templates for a dish."""
     dish_name = dish.get("name", "Signature Dish")
     restaurant_name = restaurant.get("name", "Our Restaurant")
     
     # Placeholder values for template variables
-    template_vars = {
-        "dish_name": dish_name,
-        "dish_adjective": "exquisite",
-        "restaurant_name": restaurant_name,
-        "chef_name": "Alex",
-        "pronoun": "they",
-        "key_ingredient": "locally-sourced ingredients",
-        "secondary_ingredient": "seasonal herbs",
-        "location": "Southern France",
-        "cuisine_type": "Mediterranean",
-        "event": "a summer festival",
-        "philosophy_point": "respecting ingredients and traditions",
-        "commitment_point": "sustainability and supporting local farmers",
-        "season_name": "Summer",
-        "farm_name": "Green Valley Farm",
-        "farm_distance": "15",
-        "method": "slow-cooking",
-        "quality": "freshness",
-        "culture": "Mediterranean",
-        "occasion": "harvest celebrations",
-        "cultural_significance": "community and sharing",
-        "supplier_name": "Green Valley Farm",
-        "supplier_location": "the local countryside",
-        "years": "three generations",
-        "farming_method": "traditional organic",
-        "certification": "sustainable"
-    }
+    template_vars = {**_BASE_TEMPLATE_VARS, "dish_name": dish_name, "restaurant_name": restaurant_name}
     
     # Generate templates for each narrative field
     narrative_fields = {}
-    for field, template in NARRATIVE_TEMPLATES.items():
-        # Clean up the template and format with placeholders
-        cleaned_template = clean_format_string(template)
-        formatted_text = cleaned_template.format(**template_vars)
-        
-        # Create TranslatedString
-        narrative_fields[field] = create_translated_string(formatted_text)
+    for field, render in _NARRATIVE_RENDERERS.items():
+        # Render the compiled template with placeholders and create a TranslatedString
+        narrative_fields[field] = create_translated_string(render(template_vars))
     
     # Add supplier location
     narrative_fields["supplier_location"] = {
@@ -264,8 +389,12 @@ def generate_dish_templates(dish: Dict, restaurant: Dict) -> Dict:
     return narrative_fields
 
 
-def generate_restaurant_marketing(restaurant: Dict) -> Dict:
-    """Generate marketing extension template for a restaurant."""
+def generate_restaurant_marketing(restaurant: Dict, start_time: Optional[int] = None, end_time: Optional[int] = None) -> Dict:
+    """Generate marketing extension template for a restaurant.
+    
+    Promotions run from start_time (default: now) to end_time (default: 30
+    days later). Callers generating many restaurants pass both once.
+    """
     restaurant_name = restaurant.get("name", "Our Restaurant")
     restaurant_id = restaurant.get("id", "restaurant123")
     
@@ -274,8 +403,10 @@ def generate_restaurant_marketing(restaurant: Dict) -> Dict:
     restaurant_domain = restaurant_name_no_spaces.lower() + ".com"
     
     # Current time and future time for promotions
-    current_time = int(datetime.now().timestamp())
-    future_time = int((datetime.now() + timedelta(days=30)).timestamp())
+    if start_time is None:
+        start_time = int(time.time())
+    if end_time is None:
+        end_time = start_time + PROMOTION_DAYS * 86400
     
     # Template variables
     template_vars = {
@@ -286,25 +417,24 @@ def generate_restaurant_marketing(restaurant: Dict) -> Dict:
     }
     
     # Clone the template
-    marketing = json.loads(json.dumps(MARKETING_EXTENSION_TEMPLATE))
+    marketing = copy.deepcopy(MARKETING_EXTENSION_TEMPLATE)
     
     # Format strings with template variables
-    marketing["loyalty_program"]["program_name"] = marketing["loyalty_program"]["program_name"].format(**template_vars)
-    marketing["loyalty_program"]["promo_blurb"] = marketing["loyalty_program"]["promo_blurb"].format(**template_vars)
+    marketing["loyalty_program"]["program_name"] = marketing["loyalty_program"]["program_name"].format_map(template_vars)
+    marketing["loyalty_program"]["promo_blurb"] = marketing["loyalty_program"]["promo_blurb"].format_map(template_vars)
     
     # Set promotion times
     for offer in marketing["promotional_offers"]:
-        offer["start_time"] = current_time
-        offer["end_time"] = future_time
+        offer["start_time"] = start_time
+        offer["end_time"] = end_time
     
     # Format social media
-    new_hashtags = []
-    for hashtag in marketing["social_media_strategy"]["hashtags"]:
-        new_hashtags.append(hashtag.format(**template_vars))
-    marketing["social_media_strategy"]["hashtags"] = new_hashtags
+    marketing["social_media_strategy"]["hashtags"] = [
+        hashtag.format_map(template_vars) for hashtag in marketing["social_media_strategy"]["hashtags"]
+    ]
     
     # Format CTA
-    marketing["website_cta"]["target_url"] = marketing["website_cta"]["target_url"].format(**template_vars)
+    marketing["website_cta"]["target_url"] = marketing["website_cta"]["target_url"].format_map(template_vars)
     
     # Add key message points to restaurant
     key_message_points = [
@@ -324,54 +454,55 @@ def generate_restaurant_marketing(restaurant: Dict) -> Dict:
     }
 
 
-def generate_bundle(feed: Dict, restaurant_id: str, bundle_name: str) -> Dict:
-    """Generate a bundle of dishes for a restaurant."""
-    # Find restaurant and its dishes
-    restaurant = None
-    restaurant_dishes = []
-    
-    if "restaurants" in feed:
-        for rest in feed["restaurants"]:
-            if rest.get("id") == restaurant_id:
-                restaurant = rest
-                break
-    
-    if not restaurant:
-        logging.error(f"Restaurant with ID {restaurant_id} not found")
-        return None
-    
-    # Find dishes for this restaurant
-    if "dishes" in feed:
-        for dish in feed["dishes"]:
-            if dish.get("restaurant_id") == restaurant_id:
-                restaurant_dishes.append(dish)
+def group_dishes_by_restaurant(feed: Dict) -> Dict[str, List[Dict]]:
+    """Group the feed's dishes by restaurant ID in a single pass."""
+    dishes_by_restaurant = defaultdict(list)
+    for dish in feed.get("dishes", []):
+        dishes_by_restaurant[dish.get("restaurant_id")].append(dish)
+    return dishes_by_restaurant
+
+
+def bundle_price(prices: List[int]) -> int:
+    """Return the discounted price of a bundle from its items' prices."""
+    return int(sum(prices) * (1 - BUNDLE_DISCOUNT))
+
+
+def generate_bundle(restaurant: Dict, restaurant_dishes: List[Dict], bundle_name: str) -> Dict:
+    """Generate a bundle from a restaurant's dishes."""
+    restaurant_id = restaurant.get("id")
     
     if not restaurant_dishes:
-        logging.error(f"No dishes found for restaurant {restaurant_id}")
+        logger.error(f"No dishes found for restaurant {restaurant_id}")
         return None
     
     # Select up to 3 dishes for the bundle (appetizer, main, dessert if possible)
     selected_dishes = []
-    dish_types = ["appetizer", "main", "dessert"]
+    # Track selected dishes by identity; comparing whole dish dicts is slow
+    selected_ids = set()
+    
+    # Group dishes by the types they match in one pass, lower-casing each category once
+    candidates_by_type = {dish_type: [] for dish_type in BUNDLE_DISH_TYPES}
+    for dish in restaurant_dishes:
+        category = dish.get("category", "").lower()
+        for dish_type, candidates in candidates_by_type.items():
+            if dish_type in category:
+                candidates.append(dish)
     
     # Try to find one dish of each type
-    for dish_type in dish_types:
-        for dish in restaurant_dishes:
-            category = dish.get("category", "").lower()
-            if dish_type in category and dish not in selected_dishes:
+    for candidates in candidates_by_type.values():
+        for dish in candidates:
+            if id(dish) not in selected_ids:
                 selected_dishes.append(dish)
+                selected_ids.add(id(dish))
                 break
     
     # If we couldn't find enough dishes by category, just add more
-    while len(selected_dishes) < min(3, len(restaurant_dishes)):
-        for dish in restaurant_dishes:
-            if dish not in selected_dishes:
-                selected_dishes.append(dish)
-                break
-    
-    # Calculate bundle price (with discount)
-    total_price = sum(dish.get("price", 0) for dish in selected_dishes)
-    discounted_price = int(total_price * 0.85)  # 15% bundle discount
+    for dish in restaurant_dishes:
+        if len(selected_dishes) >= 3:
+            break
+        if id(dish) not in selected_ids:
+            selected_dishes.append(dish)
+            selected_ids.add(id(dish))
     
     # Create bundle template
     template_vars = {
@@ -380,79 +511,114 @@ def generate_bundle(feed: Dict, restaurant_id: str, bundle_name: str) -> Dict:
         "restaurant_name": restaurant.get("name", "Our Restaurant")
     }
     
-    bundle = json.loads(json.dumps(BUNDLE_TEMPLATE))
+    bundle = copy.deepcopy(BUNDLE_TEMPLATE)
     
     # Format bundle fields
-    bundle["id"] = bundle["id"].format(**template_vars)
+    bundle["id"] = bundle["id"].format_map(template_vars)
     bundle["restaurant_id"] = restaurant_id
     bundle["bundle_name"] = bundle_name
     bundle["included_items"] = [dish.get("id") for dish in selected_dishes]
-    bundle["price"] = discounted_price
-    bundle["bundle_marketing_copy"] = bundle["bundle_marketing_copy"].format(**template_vars)
+    bundle["price"] = bundle_price([dish.get("price", 0) for dish in selected_dishes])
+    bundle["bundle_marketing_copy"] = bundle["bundle_marketing_copy"].format_map(template_vars)
     
     return bundle
 
 
-def create_marketing_templates(input_file: str, output_dir: str) -> bool:
-    """Create marketing templates based on a feed file."""
-    feed = load_json_file(input_file)
-    if not feed:
-        return False
+def generate_restaurant_templates(restaurant: Dict, dishes: List[Dict], start_time: Optional[int] = None,
+                                  end_time: Optional[int] = None) -> Tuple[Dict, List[Dict]]:
+    """Generate the marketing fields for a restaurant and the narrative fields for each of its dishes."""
+    return generate_restaurant_marketing(restaurant, start_time, end_time), [generate_dish_templates(dish, restaurant) for dish in dishes]
+
+
+def map_in_workers(func, *iterables: List, workers: int = 1) -> List:
+    """Apply func across the argument lists, in a process pool when workers > 1.
     
+    Results come back in input order. Tasks are sent in chunks so that
+    pickling overhead is amortized over several items.
+    """
+    if workers <= 1 or len(iterables[0]) < 2:
+        return list(map(func, *iterables))
+    
+    chunksize = max(1, len(iterables[0]) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, *iterables, chunksize=chunksize))
+
+
+def build_marketing_feed(feed: Dict, workers: int = 1) -> Dict:
+    """Add marketing templates, narrative templates and bundles to a loaded feed.
+    
+    The feed is updated in place and returned; callers own the freshly loaded
+    feed, so it is not copied.
+    """
     # Check ORFS version
     version = feed.get("header", {}).get("version", "1.0")
     if version != "1.1":
-        logging.warning(f"This tool is designed for ORFS v1.1, detected version: {version}")
-        logging.info("Will create a v1.1 feed with marketing extensions")
-    
-    # Create output feed (copy of input with marketing fields added)
-    output_feed = feed.copy()
-    output_feed["header"]["version"] = "1.1"
-    
-    # Update restaurants with marketing extensions
-    if "restaurants" in output_feed:
-        for i, restaurant in enumerate(output_feed["restaurants"]):
-            restaurant_id = restaurant.get("id", f"restaurant-{i}")
-            logging.info(f"Generating marketing templates for restaurant: {restaurant.get('name', restaurant_id)}")
-            
-            # Generate marketing extension
-            marketing_fields = generate_restaurant_marketing(restaurant)
-            
-            # Update restaurant with marketing fields
-            restaurant.update(marketing_fields)
-    
-    # Update dishes with narrative fields
-    if "dishes" in output_feed and "restaurants" in output_feed:
-        for i, dish in enumerate(output_feed["dishes"]):
-            dish_id = dish.get("id", f"dish-{i}")
-            restaurant_id = dish.get("restaurant_id")
-            
-            # Find the associated restaurant
-            restaurant = None
-            for rest in output_feed["restaurants"]:
-                if rest.get("id") == restaurant_id:
-                    restaurant = rest
-                    break
-            
-            if not restaurant:
-                logging.warning(f"Restaurant not found for dish {dish_id}, using default values")
-                restaurant = {"name": "Our Restaurant"}
-            
-            logging.info(f"Generating narrative templates for dish: {dish.get('name', dish_id)}")
-            
-            # Generate narrative fields
-            narrative_fields = generate_dish_templates(dish, restaurant)
-            
-            # Update dish with narrative fields
-            dish.update(narrative_fields)
+        logger.warning(f"This tool is designed for ORFS v1.1, detected version: {version}")
+        logger.info("Will create a v1.1 feed with marketing extensions")
+    
+    feed.setdefault("header", {})["version"] = "1.1"
+    
+    restaurants = feed.get("restaurants", [])
+    dishes_by_restaurant = group_dishes_by_restaurant(feed) if "restaurants" in feed else {}
+    
+    # Index restaurants once instead of scanning the list for every dish.
+    # Dishes belong to the first restaurant with their restaurant ID.
+    restaurants_by_id = {}
+    for rest in restaurants:
+        restaurants_by_id.setdefault(rest.get("id"), rest)
+    
+    # Each restaurant is generated together with its dishes, optionally in worker processes
+    restaurant_dishes = [
+        dishes_by_restaurant.get(rest.get("id"), []) if restaurants_by_id[rest.get("id")] is rest else []
+        for rest in restaurants
+    ]
+    # Every restaurant's promotions share one start and end time
+    start_time = int(time.time())
+    generate = functools.partial(generate_restaurant_templates, start_time=start_time,
+                                 end_time=start_time + PROMOTION_DAYS * 86400)
+    logger.info("Generating templates for %d restaurant(s) and %d dish(es)",
+                len(restaurants), sum(len(dishes) for dishes in restaurant_dishes))
+    results = map_in_workers(generate, restaurants, restaurant_dishes, workers=workers)
+    
+    # Collect the generated fields; they are merged into the feed in one pass below
+    updated_restaurants = []
+    narratives = {}
+    for restaurant, dishes, (marketing_fields, dish_fields) in zip(restaurants, restaurant_dishes, results):
+        logger.debug("Generated marketing templates for restaurant: %s", restaurant.get("name", restaurant.get("id")))
+        updated_restaurants.append({**restaurant, **marketing_fields})
+        
+        for dish, narrative_fields in zip(dishes, dish_fields):
+            logger.debug("Generated narrative templates for dish: %s", dish.get("name", dish.get("id")))
+            narratives[id(dish)] = narrative_fields
+    
+    # Dishes without a known restaurant get default values
+    for restaurant_id, dishes in dishes_by_restaurant.items():
+        if restaurant_id in restaurants_by_id:
+            continue
+        for dish in dishes:
+            dish_id = dish.get("id")
+            logger.warning(f"Restaurant not found for dish {dish_id}, using default values")
+            narratives[id(dish)] = generate_dish_templates(dish, {"name": "Our Restaurant"})
+    
+    # Build each updated restaurant and dish as a fresh dict in one step instead of
+    # inserting the generated fields key by key
+    if "restaurants" in feed:
+        feed["restaurants"] = updated_restaurants
+    if narratives:
+        feed["dishes"] = [
+            {**dish, **narratives[id(dish)]} if id(dish) in narratives else dish
+            for dish in feed["dishes"]
+        ]
     
     # Add bundles if not present
-    if "bundles" not in output_feed:
-        output_feed["bundles"] = []
+    if "bundles" not in feed:
+        feed["bundles"] = []
     
     # Generate a bundle for each restaurant
-    if "restaurants" in output_feed:
-        for restaurant in output_feed["restaurants"]:
+    if "restaurants" in feed:
+        logger.info("Generating bundles for %d restaurant(s)", len(feed["restaurants"]))
+        dishes_by_restaurant = group_dishes_by_restaurant(feed)
+        for restaurant in feed["restaurants"]:
             restaurant_id = restaurant.get("id")
             restaurant_name = restaurant.get("name", "Our Restaurant")
             
@@ -460,16 +626,71 @@ def create_marketing_templates(input_file: str, output_dir: str) -> bool:
             bundle_names = ["Chef's Selection", "Family Feast", "Date Night Special"]
             
             for bundle_name in bundle_names:
-                logging.info(f"Generating bundle '{bundle_name}' for restaurant: {restaurant_name}")
-                bundle = generate_bundle(output_feed, restaurant_id, bundle_name)
+                logger.debug("Generating bundle '%s' for restaurant: %s", bundle_name, restaurant_name)
+                bundle = generate_bundle(restaurant, dishes_by_restaurant.get(restaurant_id, []), bundle_name)
                 if bundle:
-                    output_feed["bundles"].append(bundle)
+                    feed["bundles"].append(bundle)
+    
+    return feed
+
+
+def marketing_output_file(input_file: str, output_dir: str) -> str:
+    """Return where a batch saves the marketing-enhanced version of a feed: <input name>_marketing_enhanced.json."""
+    return os.path.join(output_dir, f"{Path(input_file).stem}_marketing_enhanced.json")
+
+
+def create_marketing_templates(input_file: str, output_dir: str, workers: int = 1) -> bool:
+    """Create marketing templates based on a feed file."""
+    feed = load_json_file(input_file)
+    if not feed:
+        return False
+    
+    output_feed = build_marketing_feed(feed, workers)
     
     # Save the output feed
     output_file = os.path.join(output_dir, "marketing_enhanced_feed.json")
     return save_json_file(output_feed, output_file)
 
 
+async def save_json_file_async(data: Dict, file_path: str) -> bool:
+    """Save data to a JSON file without blocking the event loop."""
+    return await asyncio.get_event_loop().run_in_executor(None, save_json_file, data, file_path)
+
+
+async def create_marketing_templates_batch(input_files: List[str], output_dir: str, workers: int = 1) -> bool:
+    """Create marketing templates for several feed files.
+    
+    Each feed is saved as <input name>_marketing_enhanced.json (a single feed
+    keeps create_marketing_templates' marketing_enhanced_feed.json); nothing is
+    written if two inputs would share an output file. Loading, building and
+    saving each feed run in threads, so feeds are processed concurrently.
+    With worker processes, one feed is built at a time, using the whole pool.
+    """
+    output_files = [marketing_output_file(input_file, output_dir) for input_file in input_files]
+    duplicates = [path for path, count in Counter(output_files).items() if count > 1]
+    for path in duplicates:
+        sources = [input_file for input_file, output_file in zip(input_files, output_files) if output_file == path]
+        logger.error(f"Input feeds {', '.join(sources)} would all be saved to {path}; rename them or process them separately")
+    if duplicates:
+        return False
+    
+    build_slots = asyncio.Semaphore(1 if workers > 1 else len(input_files))
+    # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+    loop = asyncio.get_event_loop()
+    
+    async def process(input_file: str, output_file: str) -> bool:
+        feed = await loop.run_in_executor(None, load_json_file, input_file)
+        if not feed:
+            return False
+        
+        async with build_slots:
+            output_feed = await loop.run_in_executor(None, build_marketing_feed, feed, workers)
+        return await save_json_file_async(output_feed, output_file)
+    
+    results = await asyncio.gather(*(process(*paths) for paths in zip(input_files, output_files)))
+    return all(results)
+
+
 def enhance_narrative_field(input_file: str, dish_id: str, field_name: str) -> bool:
     """Enhance a specific narrative field for a dish."""
     feed = load_json_file(input_file)
@@ -485,7 +706,7 @@ def enhance_narrative_field(input_file: str, dish_id: str, field_name: str) -> b
                 break
     
     if not dish:
-        logging.error(f"Dish with ID {dish_id} not found")
+        logger.error(f"Dish with ID {dish_id} not found")
         return False
     
     # Find the restaurant
@@ -498,7 +719,7 @@ def enhance_narrative_field(input_file: str, dish_id: str, field_name: str) -> b
                 break
     
     if not restaurant:
-        logging.warning(f"Restaurant not found for dish {dish_id}, using default values")
+        logger.warning(f"Restaurant not found for dish {dish_id}, using default values")
         restaurant = {"name": "Our Restaurant"}
     
     # Generate narrative field templates
@@ -507,13 +728,13 @@ def enhance_narrative_field(input_file: str, dish_id: str, field_name: str) -> b
     if field_name in narrative_fields:
         # Update the specific field
         dish[field_name] = narrative_fields[field_name]
-        logging.info(f"Enhanced {field_name} for dish {dish.get('name', dish_id)}")
+        logger.info(f"Enhanced {field_name} for dish {dish.get('name', dish_id)}")
         
         # Save the updated feed
         output_file = input_file.replace(".json", f"_enhanced_{field_name}.json")
         return save_json_file(feed, output_file)
     else:
-        logging.error(f"Field {field_name} not found in narrative templates")
+        logger.error(f"Field {field_name} not found in narrative templates")
         return False
 
 
@@ -524,34 +745,30 @@ def generate_bundle_promotion(input_file: str) -> bool:
         return False
     
     if "restaurants" not in feed:
-        logging.error("No restaurants found in feed")
+        logger.error("No restaurants found in feed")
         return False
     
     # Create bundles if not present
     if "bundles" not in feed:
         feed["bundles"] = []
     
+    now = datetime.now()
+    current_month = now.strftime("%B")
+    current_season = _SEASONS[now.month - 1]
+    dishes_by_restaurant = group_dishes_by_restaurant(feed)
+    logger.info("Generating seasonal bundles for %d restaurant(s)", len(feed["restaurants"]))
     for restaurant in feed["restaurants"]:
         restaurant_id = restaurant.get("id")
         restaurant_name = restaurant.get("name", "Our Restaurant")
         
         # Create a seasonal bundle
-        current_month = datetime.now().strftime("%B")
         bundle_name = f"{current_month} Special"
         
-        logging.info(f"Generating seasonal bundle '{bundle_name}' for {restaurant_name}")
-        bundle = generate_bundle(feed, restaurant_id, bundle_name)
+        logger.debug("Generating seasonal bundle '%s' for %s", bundle_name, restaurant_name)
+        bundle = generate_bundle(restaurant, dishes_by_restaurant.get(restaurant_id, []), bundle_name)
         
         if bundle:
             # Add seasonal marketing copy
-            season_map = {
-                "January": "winter", "February": "winter", "March": "spring",
-                "April": "spring", "May": "spring", "June": "summer",
-                "July": "summer", "August": "summer", "September": "fall",
-                "October": "fall", "November": "fall", "December": "winter"
-            }
-            current_season = season_map.get(current_month, "seasonal")
-            
             bundle["bundle_marketing_copy"] = (
                 f"Celebrate {current_season} at {restaurant_name} with our {bundle_name}. "
                 f"A carefully curated selection of {len(bundle['included_items'])} dishes "
@@ -568,37 +785,52 @@ def generate_bundle_promotion(input_file: str) -> bool:
 def main():
     parser = argparse.ArgumentParser(description='ORFS Marketing Content Generator')
     group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument('--create-templates', help='Create marketing templates based on a basic feed file')
+    group.add_argument('--create-templates', nargs='+', metavar='FEED',
+                       help='Create marketing templates based on one or more basic feed files')
     group.add_argument('--enhance-field', help='Enhance a specific narrative field for a dish')
     group.add_argument('--generate-bundle-promotion', action='store_true', help='Generate a bundle promotion for each restaurant')
     
     parser.add_argument('--output', help='Output directory for generated files')
     parser.add_argument('--input', help='Input feed file')
     parser.add_argument('--dish-id', help='ID of the dish to enhance')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for --create-templates (default: 1, 0 = one per CPU)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
     
     args = parser.parse_args()
     
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     
     if args.create_templates:
         if not args.output:
-            logging.error("--output directory is required with --create-templates")
+            logger.error("--output directory is required with --create-templates")
             sys.exit(1)
         
-        success = create_marketing_templates(args.create_templates, args.output)
+        workers = args.workers or os.cpu_count() or 1
+        if len(args.create_templates) == 1:
+            success = create_marketing_templates(args.create_templates[0], args.output, workers)
+        else:
+            # A loop of our own rather than asyncio.run, which needs Python 3.7
+            loop = asyncio.new_event_loop()
+            try:
+                success = loop.run_until_complete(
+                    create_marketing_templates_batch(args.create_templates, args.output, workers))
+            finally:
+                loop.close()
     
     elif args.enhance_field:
         if not args.input or not args.dish_id:
-            logging.error("--input and --dish-id are required with --enhance-field")
+            logger.error("--input and --dish-id are required with --enhance-field")
             sys.exit(1)
         
         success = enhance_narrative_field(args.input, args.dish_id, args.enhance_field)
     
     elif args.generate_bundle_promotion:
         if not args.input:
-            logging.error("--input is required with --generate-bundle-promotion")
+            logger.error("--input is required with --generate-bundle-promotion")
             sys.exit(1)
         
         success = generate_bundle_promotion(args.input)
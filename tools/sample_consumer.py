@@ -16,68 +16,105 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+    _STREAM_ERRORS = (ijson.JSONError,)
+except ImportError:
+    ijson = None
+    _STREAM_ERRORS = ()
+
 # In a real implementation, this would import generated Protocol Buffer classes
 # from the ORFS proto definitions
 # from orfs_pb2 import FeedMessage
 
 
+def iter_feed_section(json_file_path, prefix):
+    """Yield the items at an ijson prefix (e.g. "restaurants.item") without loading the whole feed."""
+    with open(json_file_path, "rb") as feed_file:
+        yield from ijson.items(feed_file, prefix, use_float=True)
+
+
+def format_restaurant(restaurant):
+    """Format the summary printed for one restaurant."""
+    lines = [
+        f"\n- {restaurant.get('name', 'Unnamed Restaurant')}",
+        f"  ID: {restaurant.get('id', 'No ID')}",
+        f"  Description: {restaurant.get('description', 'No description')}"
+    ]
+    
+    # Location info
+    location = restaurant.get("location", {})
+    if location:
+        lines.append(f"  Address: {location.get('address', 'No address')}")
+        lines.append(f"  Coordinates: {location.get('latitude', 'N/A')}, {location.get('longitude', 'N/A')}")
+    
+    # Menu summary
+    menus = restaurant.get("menus", [])
+    lines.append(f"  Menus: {len(menus)}")
+    
+    for menu in menus:
+        lines.append(f"    - {menu.get('name', 'Unnamed Menu')}")
+        dishes = menu.get("dishes", [])
+        lines.append(f"      Dishes: {len(dishes)}")
+        
+        # Print first few dishes
+        for i, dish in enumerate(dishes[:3]):
+            price_info = dish.get("price", {})
+            price_str = f"{price_info.get('amount', 'N/A')} {price_info.get('currency', '')}"
+            lines.append(f"        {dish.get('name', 'Unnamed Dish')} - {price_str}")
+        
+        if len(dishes) > 3:
+            lines.append(f"        ... and {len(dishes) - 3} more dishes")
+    
+    # Table summary
+    tables = restaurant.get("tables", [])
+    lines.append(f"  Tables: {len(tables)}")
+    
+    return "\n".join(lines)
+
+
 def process_static_feed(json_file_path):
     """Process a static ORFS JSON feed."""
-    # Load the feed file
+    # Load the feed file. With ijson, restaurants are parsed and summarized one
+    # at a time so the full feed is never held in memory.
     try:
-        with open(json_file_path, "r") as feed_file:
-            feed = json.load(feed_file)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        if ijson is not None:
+            header = next(iter_feed_section(json_file_path, "header"), {})
+            summaries = [format_restaurant(r) for r in iter_feed_section(json_file_path, "restaurants.item")]
+        else:
+            if orjson is not None:
+                feed = orjson.loads(Path(json_file_path).read_bytes())
+            else:
+                with open(json_file_path, "r") as feed_file:
+                    feed = json.load(feed_file)
+            header = feed.get("header", {})
+            summaries = [format_restaurant(r) for r in feed.get("restaurants", [])]
+    except (FileNotFoundError, json.JSONDecodeError, *_STREAM_ERRORS) as e:
         print(f"Error: Could not load feed file: {e}")
         return False
 
     # Process header
-    header = feed.get("header", {})
     version = header.get("version", "unknown")
     timestamp = header.get("timestamp", 0)
     timestamp_str = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
     provider = header.get("provider", "unknown")
     
-    print(f"ORFS Feed Version: {version}")
-    print(f"Feed Timestamp: {timestamp_str}")
-    print(f"Feed Provider: {provider}")
-    
-    # Process restaurants
-    restaurants = feed.get("restaurants", [])
-    print(f"\nFound {len(restaurants)} restaurants in feed:")
-    
-    for restaurant in restaurants:
-        print(f"\n- {restaurant.get('name', 'Unnamed Restaurant')}")
-        print(f"  ID: {restaurant.get('id', 'No ID')}")
-        print(f"  Description: {restaurant.get('description', 'No description')}")
-        
-        # Location info
-        location = restaurant.get("location", {})
-        if location:
-            print(f"  Address: {location.get('address', 'No address')}")
-            print(f"  Coordinates: {location.get('latitude', 'N/A')}, {location.get('longitude', 'N/A')}")
-        
-        # Menu summary
-        menus = restaurant.get("menus", [])
-        print(f"  Menus: {len(menus)}")
-        
-        for menu in menus:
-            print(f"    - {menu.get('name', 'Unnamed Menu')}")
-            dishes = menu.get("dishes", [])
-            print(f"      Dishes: {len(dishes)}")
-            
-            # Print first few dishes
-            for i, dish in enumerate(dishes[:3]):
-                price_info = dish.get("price", {})
-                price_str = f"{price_info.get('amount', 'N/A')} {price_info.get('currency', '')}"
-                print(f"        {dish.get('name', 'Unnamed Dish')} - {price_str}")
-            
-            if len(dishes) > 3:
-                print(f"        ... and {len(dishes) - 3} more dishes")
-        
-        # Table summary
-        tables = restaurant.get("tables", [])
-        print(f"  Tables: {len(tables)}")
+    # Write the whole report at once rather than print() per line
+    lines = [
+        f"ORFS Feed Version: {version}",
+        f"Feed Timestamp: {timestamp_str}",
+        f"Feed Provider: {provider}",
+        # Process restaurants
+        f"\nFound {len(summaries)} restaurants in feed:",
+        *summaries
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
         
     return True
 
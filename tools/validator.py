@@ -9,34 +9,59 @@ Supports both ORFS v1.0 and v1.1 with enhanced validation for marketing fields.
 
 Usage:
   python validator.py --static path/to/static_feed.json
+  python validator.py --static-dir path/to/feeds/ --workers 0
   python validator.py --realtime path/to/realtime_feed.json
   python validator.py --marketing-check path/to/feed.json
   python validator.py --marketing-check path/to/feed.json --content-quality
   python validator.py --marketing-check path/to/feed.json --seo-check
   python validator.py --marketing-check path/to/feed.json --all-checks
+  python validator.py --marketing-check path/to/feed.json --all-checks --streaming --max-errors 100
 """
 
 import argparse
+import functools
+import hashlib
+import importlib.util
+import itertools
 import json
 import os
 import sys
 import re
 import logging
+import marshal
+import mmap
+import stat
 import statistics
 import string
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional, Set
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple, Optional, Set, Iterable, Iterator
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
-try:
+if TYPE_CHECKING:
     import jsonschema
+
+try:
+    import orjson
 except ImportError:
-    print("Error: jsonschema package is required. Install with: pip install jsonschema")
-    sys.exit(1)
+    orjson = None
+
+try:
+    import ijson
+    _STREAM_ERRORS = (ijson.JSONError,)
+except ImportError:
+    ijson = None
+    _STREAM_ERRORS = ()
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 try:
     import google.protobuf
+    from google.protobuf.message import DecodeError
 except ImportError:
     print("Error: protobuf package is required. Install with: pip install protobuf")
     sys.exit(1)
@@ -48,9 +73,24 @@ logging.basicConfig(
 )
 
 
+def _loads_mapped(file_path: str) -> Any:
+    """Decode a JSON file with orjson straight from a read-only memory map, without copying it into bytes first.
+    
+    Pipes, process substitution and other non-regular or empty files are read normally.
+    """
+    with open(file_path, "rb") as f:
+        info = os.fstat(f.fileno())
+        if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
 def load_json_file(file_path: str) -> Optional[Dict]:
     """Load and parse a JSON file."""
     try:
+        if orjson is not None:
+            return _loads_mapped(file_path)
         with open(file_path, "r") as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError) as e:
@@ -58,34 +98,439 @@ def load_json_file(file_path: str) -> Optional[Dict]:
         return None
 
 
-def validate_static_feed(json_file_path: str) -> bool:
-    """Validate a static ORFS JSON feed against the schema."""
-    # Load the schema
-    schema_path = Path(__file__).parent.parent / "best-practices" / "orfs-schema.json"
-    schema = load_json_file(schema_path)
+SCHEMA_PATH = Path(__file__).parent.parent / "best-practices" / "orfs-schema.json"
+
+# Running "protoc --python_out=. proto/orfs.proto" from the repository root generates orfs_pb2.py here
+PROTO_DIR = Path(__file__).parent.parent / "proto"
+
+# Bytecode of the fastjsonschema functions is cached here across runs
+FAST_VALIDATOR_CACHE_DIR = Path(__file__).parent / "__pycache__"
+
+# Static feeds at least this large are schema-validated item by item with ijson
+STREAMING_THRESHOLD = 16 * 1024 * 1024
+
+# Splits narrative content into sentences for the sentence-variety check
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Characters that count as proper closing punctuation for narrative content
+_END_PUNCT = frozenset(".!?")
+
+# TranslatedString narrative fields checked on each dish
+NARRATIVE_FIELDS = ("chef_story", "chef_highlight", "chef_anecdote", "culinary_philosophy",
+                    "seasonal_story", "cultural_context", "ingredient_story")
+
+_NARRATIVE_SET = frozenset(NARRATIVE_FIELDS)
+
+# Narrative fields expected to run to at least 30 words
+_LONG_NARRATIVE_FIELDS = frozenset({"chef_story", "seasonal_story", "cultural_context"})
+
+# Narrative fields whose text feeds the SEO analysis
+SEO_NARRATIVE_FIELDS = ("chef_story", "chef_highlight", "seasonal_story", "cultural_context", "ingredient_story")
+_SEO_NARRATIVE_SET = frozenset(SEO_NARRATIVE_FIELDS)
+
+# Address parts a detailed supplier_location must fill in
+SUPPLIER_ADDRESS_FIELDS = ("street_address", "locality", "state", "country")
+
+# Common words left out of the SEO word frequencies (simplified list)
+_SEO_STOPWORDS = frozenset({"a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for", "is", "are", "was", "were"})
+
+# Dishes handed to the worker pool at a time, so streamed feeds stay bounded in memory
+DISH_BATCH_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(schema_path: str) -> Optional[Dict]:
+    """Load a JSON schema once per process."""
+    return load_json_file(schema_path)
+
+
+def _denormalize_schema(schema: Dict) -> Dict:
+    """Return a copy of schema with local "#/definitions/..." references inlined.
+    
+    Validating against the inlined copy skips reference resolution for every
+    restaurant, dish and nested object. Recursive references are left in
+    place, so the definitions are kept alongside.
+    """
+    definitions = schema.get("definitions", {})
+    
+    def inline(node, seen):
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/definitions/"):
+                name = ref[len("#/definitions/"):]
+                if name in definitions and name not in seen:
+                    return inline(definitions[name], seen | {name})
+            return {key: inline(value, seen) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(item, seen) for item in node]
+        return node
+    
+    return {key: value if key == "definitions" else inline(value, frozenset()) for key, value in schema.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _import_jsonschema():
+    """Import jsonschema on first use.
+    
+    It is the slowest import here (~50ms), and realtime and marketing checks,
+    or static feeds accepted by fastjsonschema, never need it.
+    """
+    try:
+        import jsonschema
+    except ImportError:
+        print("Error: jsonschema package is required. Install with: pip install jsonschema")
+        sys.exit(1)
+    return jsonschema
+
+
+def _schema_key(schema: Dict) -> str:
+    """Return a digest of the schema's canonical JSON, shared by equivalent schemas."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Validators built in this process, keyed by _schema_key rather than by path
+_SCHEMA_VALIDATORS: Dict[str, Any] = {}
+_FAST_VALIDATORS: Dict[str, Any] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_validator(schema_path: str = str(SCHEMA_PATH)):
+    """Return a jsonschema validator for the schema, checked and built once per process."""
+    schema = load_schema(schema_path)
+    if schema is None:
+        return None
+    
+    key = _schema_key(schema)
+    if key not in _SCHEMA_VALIDATORS:
+        cls = _import_jsonschema().validators.validator_for(schema)
+        cls.check_schema(schema)
+        _SCHEMA_VALIDATORS[key] = cls(_denormalize_schema(schema))
+    return _SCHEMA_VALIDATORS[key]
+
+
+def _compile_fast_validator(schema: Dict, cache_name: str):
+    """Compile schema with fastjsonschema, reusing the bytecode cached by an earlier run.
+    
+    Compiled functions and their cache files are keyed by the schema's
+    content, so an edited schema never picks up stale code and equivalent
+    schemas share one compilation. cache_name names the schema's cache
+    slot: writing a new cache file removes the older ones in that slot.
+    """
+    key = _schema_key(schema)
+    if key in _FAST_VALIDATORS:
+        return _FAST_VALIDATORS[key]
+    
+    prefix = f"fastjsonschema-{cache_name}-"
+    suffix = f".{fastjsonschema.VERSION}.{sys.implementation.cache_tag}.bin"
+    cache_path = FAST_VALIDATOR_CACHE_DIR / f"{prefix}{key}{suffix}"
+    try:
+        code = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        code = None
+    
+    if code is None:
+        code = compile(fastjsonschema.compile_to_code(schema), f"<fastjsonschema {key}>", "exec")
+        # Written to a temporary file and renamed, so concurrent runs never read a partial cache
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            FAST_VALIDATOR_CACHE_DIR.mkdir(exist_ok=True)
+            temp_path.write_bytes(marshal.dumps(code))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logging.debug(f"Could not cache compiled validator at {cache_path}: {e}")
+        else:
+            _remove_stale_fast_validators(cache_path, prefix, suffix)
+    
+    namespace = {}
+    exec(code, namespace)
+    _FAST_VALIDATORS[key] = namespace["validate"]
+    return _FAST_VALIDATORS[key]
+
+
+def _remove_stale_fast_validators(cache_path: Path, prefix: str, suffix: str):
+    """Delete the cache files compiled from earlier versions of the schema in cache_path's slot."""
+    # Matched exactly, so a slot never removes the files of a slot whose name extends it
+    stale = re.compile(re.escape(prefix) + r"[0-9a-f]{32}" + re.escape(suffix))
+    for path in FAST_VALIDATOR_CACHE_DIR.glob(f"{prefix}*{suffix}"):
+        if path != cache_path and stale.fullmatch(path.name):
+            try:
+                path.unlink()
+            except OSError as e:
+                logging.debug(f"Could not remove stale compiled validator {path}: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def get_fast_validator(schema_path: str = str(SCHEMA_PATH)):
+    """Return a fastjsonschema function compiled from the schema, or None if unavailable."""
+    if fastjsonschema is None:
+        return None
+    
+    schema = load_schema(schema_path)
     if schema is None:
-        return False
+        return None
+    
+    try:
+        return _compile_fast_validator(schema, Path(schema_path).stem)
+    except fastjsonschema.JsonSchemaDefinitionException as e:
+        logging.debug(f"fastjsonschema cannot compile {schema_path}: {e}")
+        return None
+
+
+def _streamable_arrays(schema: Dict) -> Dict[str, Dict]:
+    """Return the item schemas of top-level array properties that constrain nothing but their items."""
+    return {
+        key: prop["items"]
+        for key, prop in schema.get("properties", {}).items()
+        if prop.get("type") == "array" and isinstance(prop.get("items"), dict)
+        and set(prop) <= {"type", "items", "description", "example"}
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_fast_item_validators(schema_path: str = str(SCHEMA_PATH)) -> Dict[str, Any]:
+    """Return fastjsonschema functions for the item schemas of the streamable arrays.
+    
+    Empty if fastjsonschema is unavailable or cannot compile an item schema.
+    """
+    if fastjsonschema is None:
+        return {}
+    
+    schema = load_schema(schema_path)
+    if schema is None:
+        return {}
+    
+    # Item schemas refer to the shared definitions, so each is compiled alongside them
+    shared = {key: schema[key] for key in ("$schema", "definitions") if key in schema}
+    try:
+        return {
+            key: _compile_fast_validator({**items, **shared}, f"{Path(schema_path).stem}.{key}")
+            for key, items in _streamable_arrays(schema).items()
+        }
+    except fastjsonschema.JsonSchemaDefinitionException as e:
+        logging.debug(f"fastjsonschema cannot compile the item schemas of {schema_path}: {e}")
+        return {}
+
+
+def iter_streamed_schema_errors(validator, json_file_path: str,
+                                fast_validators: Optional[Dict[str, Any]] = None) -> Iterator["jsonschema.ValidationError"]:
+    """Yield schema errors for a feed without loading its large top-level arrays.
+    
+    Each item of a streamable top-level array is built from the ijson event
+    stream, validated against the item schema and dropped. The rest of the
+    feed, with those arrays left empty, is validated at the end. Items that
+    pass the matching fast_validators function skip jsonschema entirely.
+    """
+    fast_validators = fast_validators or {}
+    # Item schemas are already inlined; recursive references still resolve against
+    # the shared definitions. type(validator)(...) rather than evolve(), which needs jsonschema 4
+    definitions = {"definitions": validator.schema["definitions"]} if "definitions" in validator.schema else {}
+    item_validators = {
+        key: type(validator)({**items, **definitions}) for key, items in _streamable_arrays(validator.schema).items()
+    }
+    shell = ijson.ObjectBuilder()
+    current = None
+    builder = None
+    index = 0
+    
+    with open(json_file_path, "rb") as feed_file:
+        for prefix, event, value in ijson.parse(feed_file, use_float=True):
+            if current is None:
+                shell.event(event, value)
+                if event == "start_array" and prefix in item_validators:
+                    current, item_prefix, index = prefix, f"{prefix}.item", 0
+                    item_validator = item_validators[prefix]
+                    fast_validator = fast_validators.get(prefix)
+                continue
+            
+            if builder is None:
+                if event == "end_array" and prefix == current:
+                    shell.event(event, value)
+                    current = None
+                    continue
+                builder = ijson.ObjectBuilder()
+                build = builder.event
+            
+            build(event, value)
+            # An item is complete at the first closing or scalar event carrying the
+            # item prefix itself; events nested inside it have longer prefixes
+            if prefix != item_prefix or event in ("start_map", "start_array", "map_key"):
+                continue
+            
+            if fast_validator is not None:
+                try:
+                    fast_validator(builder.value)
+                    builder = None
+                    index += 1
+                    continue
+                except fastjsonschema.JsonSchemaException:
+                    pass
+            for error in item_validator.iter_errors(builder.value):
+                error.path.extendleft((index, current))
+                error.schema_path.extendleft(("items", current, "properties"))
+                yield error
+            builder = None
+            index += 1
+    
+    yield from validator.iter_errors(shell.value)
+
+
+def _static_feed_errors(json_file_path: str,
+                        streaming: Optional[bool] = None) -> Optional[Tuple[Dict, Iterator["jsonschema.ValidationError"]]]:
+    """Return a static feed's header and an iterator over its schema errors, or None if it cannot be loaded.
+    
+    Feeds of STREAMING_THRESHOLD bytes or more are validated item by item
+    with ijson unless streaming is set explicitly. The compiled fastjsonschema
+    functions, when available, accept valid feeds (or streamed items) quickly;
+    jsonschema reports the details for those they reject.
+    """
+    if streaming is None:
+        try:
+            streaming = os.path.getsize(json_file_path) >= STREAMING_THRESHOLD
+        except OSError:
+            streaming = False
+    if streaming and ijson is None:
+        logging.warning("ijson is not installed; loading the whole feed instead of streaming it")
+        streaming = False
+    
+    if streaming:
+        try:
+            header = next(iter_feed_section(json_file_path, "header"), {})
+        except (FileNotFoundError, *_STREAM_ERRORS) as e:
+            logging.error(f"Could not load file {json_file_path}: {e}")
+            return None
+        validator = get_schema_validator(str(SCHEMA_PATH))
+        if validator is None:
+            return None
+        fast_validators = get_fast_item_validators(str(SCHEMA_PATH))
+        return header, iter_streamed_schema_errors(validator, json_file_path, fast_validators)
     
     # Load the feed file
     feed = load_json_file(json_file_path)
     if feed is None:
+        return None
+    header = feed.get("header", {})
+    
+    fast_validator = get_fast_validator(str(SCHEMA_PATH))
+    if fast_validator is not None:
+        try:
+            fast_validator(feed)
+            return header, iter(())
+        except fastjsonschema.JsonSchemaException:
+            pass
+    
+    # Build the schema validator (cached after the first call) only for feeds
+    # fastjsonschema could not accept
+    validator = get_schema_validator(str(SCHEMA_PATH))
+    if validator is None:
+        return None
+    return header, validator.iter_errors(feed)
+
+
+def _json_path(error: "jsonschema.ValidationError") -> str:
+    """Return where an error occurred as a JSONPath such as "$.dishes[0].price".
+    
+    Built from absolute_path since ValidationError.json_path needs jsonschema 4.
+    """
+    return "$" + "".join(f"[{part}]" if isinstance(part, int) else f".{part}" for part in error.absolute_path)
+
+
+def validate_static_feed(json_file_path: str, all_errors: bool = False, streaming: Optional[bool] = None,
+                         max_errors: int = 0) -> bool:
+    """Validate a static ORFS JSON feed against the schema.
+    
+    Stops at the first schema error unless all_errors is set, in which case
+    every error (up to max_errors, when set) is collected in a single pass
+    and reported along with the most relevant one.
+    """
+    loaded = _static_feed_errors(json_file_path, streaming)
+    if loaded is None:
         return False
+    header, errors = loaded
     
     # Check ORFS version
-    version = feed.get("header", {}).get("version", "1.0")
+    version = header.get("version", "1.0")
     logging.info(f"Detected ORFS version: {version}")
     
     # Validate against schema
     try:
-        jsonschema.validate(instance=feed, schema=schema)
-        print(f"✅ Static feed at {json_file_path} is valid according to JSON schema!")
-        return True
-    except jsonschema.exceptions.ValidationError as e:
-        print(f"❌ Schema validation error: {e}")
+        if all_errors:
+            errors = list(itertools.islice(errors, max_errors or None))
+            if errors:
+                print(f"❌ Found {len(errors)} schema validation errors:")
+                for error in errors:
+                    print(f"  - {_json_path(error)}: {error.message}")
+                if max_errors and len(errors) >= max_errors:
+                    print(f"Stopped after {max_errors} errors (--max-errors)")
+                
+                best = _import_jsonschema().exceptions.best_match(errors)
+                print(f"Most relevant error: {_json_path(best)}: {best.message}")
+                return False
+        else:
+            error = next(errors, None)
+            if error is not None:
+                # Path and message only; str(error) would also format the whole
+                # failing subschema and instance
+                print(f"❌ Schema validation error at {_json_path(error)}: {error.message}")
+                return False
+    except _STREAM_ERRORS as e:
+        logging.error(f"Could not load file {json_file_path}: {e}")
         return False
+    
+    print(f"✅ Static feed at {json_file_path} is valid according to JSON schema!")
+    return True
 
 
-def validate_realtime_feed(proto_file_path: str) -> bool:
+def _warm_validators() -> None:
+    """Build the cached schema validators, so forked pool workers inherit them instead of compiling their own."""
+    get_schema_validator(str(SCHEMA_PATH))
+    get_fast_validator(str(SCHEMA_PATH))
+    get_fast_item_validators(str(SCHEMA_PATH))
+
+
+def _check_static_file(json_file_path: str) -> Tuple[str, Optional[str]]:
+    """Return the feed path and a one-line description of its first problem, or None if it is valid."""
+    loaded = _static_feed_errors(json_file_path)
+    if loaded is None:
+        return json_file_path, "could not be loaded"
+    
+    try:
+        error = next(loaded[1], None)
+    except _STREAM_ERRORS as e:
+        return json_file_path, f"could not be parsed: {e}"
+    return json_file_path, None if error is None else f"{_json_path(error)}: {error.message}"
+
+
+def validate_static_dir(directory: str, workers: int = 1) -> bool:
+    """Validate every *.json static feed in a directory, spreading the feeds over worker processes."""
+    paths = sorted(str(path) for path in Path(directory).glob("*.json"))
+    if not paths:
+        logging.error(f"No JSON feeds found in {directory}")
+        return False
+    
+    # Compiled here so forked workers inherit the cached validators; with
+    # other start methods each worker builds and caches them on its first feed
+    _warm_validators()
+    if workers > 1 and len(paths) > 1:
+        chunksize = max(1, len(paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_check_static_file, paths, chunksize=chunksize))
+    else:
+        results = [_check_static_file(path) for path in paths]
+    
+    failures = 0
+    for path, problem in results:
+        if problem is None:
+            print(f"✅ {path}")
+        else:
+            failures += 1
+            print(f"❌ {path}: {problem}")
+    
+    print(f"\n{len(paths) - failures} of {len(paths)} static feeds in {directory} are valid according to JSON schema")
+    return failures == 0
+
+
+def validate_realtime_feed(proto_file_path: str, delimited: bool = False) -> bool:
     """Validate a realtime ORFS Protocol Buffer feed."""
     # Check if it's actually a JSON file (some realtime feeds might be in JSON format)
     if proto_file_path.endswith('.json'):
@@ -98,23 +543,28 @@ def validate_realtime_feed(proto_file_path: str) -> bool:
             logging.error("Realtime feed missing required 'header' or 'entity' fields")
             return False
         
+        header = feed["header"]
+        
         # Check ORFS version
-        version = feed.get("header", {}).get("version", "1.0")
+        version = header.get("version", "1.0")
         logging.info(f"Detected ORFS version: {version}")
         
         # Check incrementality field
-        incrementality = feed.get("header", {}).get("incrementality")
-        if incrementality not in ["FULL_DATASET", "DIFFERENTIAL"]:
+        incrementality = header.get("incrementality")
+        if incrementality not in ("FULL_DATASET", "DIFFERENTIAL"):
             logging.error(f"Invalid incrementality value: {incrementality}")
             return False
         
         print(f"✅ Realtime feed (JSON format) at {proto_file_path} has valid structure!")
         return True
+    elif _load_orfs_pb2() is not None:
+        return validate_realtime_proto(proto_file_path, delimited)
     else:
         # For actual Protocol Buffer files
         try:
-            # This would use the compiled protobuf definitions to parse and validate
-            logging.warning("Full Protocol Buffer validation not implemented yet")
+            # Without the generated orfs_pb2 module the message cannot be parsed
+            logging.warning("orfs_pb2 not found; run 'protoc --python_out=. proto/orfs.proto' from the repository root, "
+                            "or put orfs_pb2 on PYTHONPATH, to enable full Protocol Buffer validation")
             logging.info("Performing basic file checks only")
             
             # Check if file exists and is not empty
@@ -127,406 +577,667 @@ def validate_realtime_feed(proto_file_path: str) -> bool:
                 return False
             
             print(f"✅ Realtime feed at {proto_file_path} exists and is not empty.")
-            print("Note: Full Protocol Buffer validation is not implemented.")
+            print("Note: Full Protocol Buffer validation requires the generated orfs_pb2 module.")
             return True
         except Exception as e:
             logging.error(f"Error validating Protocol Buffer file: {e}")
             return False
 
 
-def validate_marketing_fields(json_file_path: str, content_quality: bool = False, seo_check: bool = False) -> bool:
-    """Perform extended validation on ORFS v1.1 marketing fields."""
-    feed = load_json_file(json_file_path)
-    if feed is None:
+@functools.lru_cache(maxsize=None)
+def _load_orfs_pb2():
+    """Import the generated FeedMessage bindings, or return None if they are missing.
+    
+    The module is imported from the Python path, or else from PROTO_DIR where
+    the documented protoc command writes it. Only realtime validation needs
+    it, so static and marketing checks never pay for loading the protobuf runtime.
+    """
+    try:
+        import orfs_pb2
+        return orfs_pb2
+    except ImportError:
+        pass
+    
+    generated = PROTO_DIR / "orfs_pb2.py"
+    if not generated.is_file():
+        return None
+    spec = importlib.util.spec_from_file_location("orfs_pb2", generated)
+    orfs_pb2 = importlib.util.module_from_spec(spec)
+    sys.modules["orfs_pb2"] = orfs_pb2
+    spec.loader.exec_module(orfs_pb2)
+    return orfs_pb2
+
+
+def _iter_delimited(data: memoryview) -> Iterator[memoryview]:
+    """Yield the messages of a varint length-delimited stream as zero-copy slices of data."""
+    pos = 0
+    end = len(data)
+    while pos < end:
+        size = 0
+        shift = 0
+        while True:
+            if pos >= end:
+                raise DecodeError("Truncated message length prefix")
+            byte = data[pos]
+            pos += 1
+            size |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+            shift += 7
+            if shift >= 64:
+                raise DecodeError("Invalid message length prefix")
+        
+        if pos + size > end:
+            raise DecodeError("Truncated message")
+        yield data[pos:pos + size]
+        pos += size
+
+
+def _feed_message_problem(feed) -> Optional[str]:
+    """Return why a parsed FeedMessage is invalid, or None if its required fields are present."""
+    if not feed.HasField("header"):
+        return "Realtime feed missing required 'header' field"
+    
+    missing_ids = sum(1 for entity in feed.entity if not entity.id)
+    if missing_ids:
+        return f"{missing_ids} feed entities are missing the required id"
+    return None
+
+
+def validate_realtime_proto(proto_file_path: str, delimited: bool = False) -> bool:
+    """Parse a binary realtime feed as a FeedMessage and check its required fields.
+    
+    With delimited=True the file is a stream of varint length-prefixed
+    FeedMessages, each parsed straight from a slice of the mapped file.
+    """
+    # Map the file rather than reading it, so messages are parsed straight
+    # from the page cache; the mapping is released with the last view of it
+    try:
+        with open(proto_file_path, "rb") as feed_file:
+            info = os.fstat(feed_file.fileno())
+            if stat.S_ISREG(info.st_mode) and info.st_size:
+                data = memoryview(mmap.mmap(feed_file.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                data = memoryview(feed_file.read())
+    except OSError as e:
+        logging.error(f"Could not parse Protocol Buffer file {proto_file_path}: {e}")
         return False
     
-    # Check ORFS version
-    version = feed.get("header", {}).get("version", "1.0")
-    if version != "1.1":
-        logging.warning(f"Marketing fields validation is designed for ORFS v1.1, detected version: {version}")
+    orfs_pb2 = _load_orfs_pb2()
+    frames = _iter_delimited(data) if delimited else (data,)
+    messages = 0
+    entities = 0
+    try:
+        for messages, frame in enumerate(frames, 1):
+            # A fresh message per frame is cheaper than Clear() + MergeFromString()
+            # on the upb backend, which has to release the old arena first
+            feed = orfs_pb2.FeedMessage()
+            feed.ParseFromString(frame)
+            
+            problem = _feed_message_problem(feed)
+            if problem:
+                logging.error(f"{problem} (message {messages})" if delimited else problem)
+                return False
+            
+            # Check ORFS version
+            if messages == 1:
+                version = feed.header.orfs_version or "1.0"
+                logging.info(f"Detected ORFS version: {version}")
+            entities += len(feed.entity)
+    except DecodeError as e:
+        logging.error(f"Could not parse Protocol Buffer file {proto_file_path}: {e}")
+        return False
+    
+    if not delimited:
+        print(f"✅ Realtime feed at {proto_file_path} is a valid FeedMessage with {entities} entities!")
+        return True
+    if not messages:
+        logging.error(f"Delimited realtime feed {proto_file_path} contains no messages")
+        return False
     
+    print(f"✅ Realtime feed at {proto_file_path} has {messages} valid FeedMessages with {entities} entities!")
+    return True
+
+
+def _present_fields(item: Dict, fields: Tuple[str, ...], field_set: frozenset) -> List[str]:
+    """Return the fields present in item, in the order of fields.
+    
+    Items with none of the fields are ruled out by a single set test.
+    """
+    if item.keys().isdisjoint(field_set):
+        return []
+    return [field for field in fields if field in item]
+
+
+def _text_stats(text: str) -> Tuple[int, int, bool]:
+    """Return the word count, total word length and whether text ends with closing punctuation."""
+    words = text.split()
+    return len(words), len("".join(words)), text[-1:] in _END_PUNCT
+
+
+def _has_uniform_sentences(text: str) -> bool:
+    """Return True if text has two or more sentences and all have the same word count.
+    
+    Blank fragments between terminators are skipped, and the scan stops at the
+    first sentence whose length differs.
+    """
+    counts = (n for n in map(len, map(str.split, _SENT_RE.split(text))) if n)
+    first = next(counts, None)
+    if first is None:
+        return False
+    
+    sentences = 1
+    for n in counts:
+        if n != first:
+            return False
+        sentences += 1
+    return sentences > 1
+
+
+def _check_restaurant(restaurant: Dict, index: int, content_quality: bool = False) -> List[str]:
+    """Return the marketing field issues for one restaurant."""
     validation_issues = []
+    restaurant_id = restaurant.get("id", f"restaurant-{index}")
     
-    # Check restaurant marketing extensions
-    if "restaurants" in feed:
-        for i, restaurant in enumerate(feed["restaurants"]):
-            restaurant_id = restaurant.get("id", f"restaurant-{i}")
+    # Check key_message_points
+    if "key_message_points" in restaurant:
+        points = restaurant["key_message_points"]
+        if not points or not isinstance(points, list):
+            validation_issues.append(
+                f"Restaurant '{restaurant_id}' has empty or invalid key_message_points")
+        elif content_quality:
+            # Check if key messages are effective (3-7 words is ideal for a key message)
+            for j, point in enumerate(points):
+                words = point.split()
+                if len(words) < 3:
+                    validation_issues.append(
+                        f"Restaurant '{restaurant_id}' key_message_point[{j}] is too short ({len(words)} words). Aim for 3-7 words.")
+                elif len(words) > 10:
+                    validation_issues.append(
+                        f"Restaurant '{restaurant_id}' key_message_point[{j}] is too long ({len(words)} words). Aim for 3-7 words.")
+    
+    # Check suggested_prompt_template
+    if "suggested_prompt_template" in restaurant:
+        template = restaurant["suggested_prompt_template"]
+        if not template or not isinstance(template, str):
+            validation_issues.append(
+                f"Restaurant '{restaurant_id}' has empty or invalid suggested_prompt_template")
+        else:
+            for var in ("restaurant_name", "key_message_points", "length"):
+                if '{' + var + '}' not in template:
+                    validation_issues.append(
+                        f"Restaurant '{restaurant_id}' suggested_prompt_template should include {{{var}}}")
+    
+    # Check marketing_extension
+    if "marketing_extension" in restaurant:
+        marketing = restaurant["marketing_extension"]
+        
+        # Validate loyalty program
+        if "loyalty_program" in marketing:
+            program = marketing["loyalty_program"]
+            if "tiers" in program and (not program["tiers"] or not isinstance(program["tiers"], list)):
+                validation_issues.append(
+                    f"Restaurant '{restaurant_id}' has invalid loyalty program tiers")
             
-            # Check key_message_points
-            if "key_message_points" in restaurant:
-                points = restaurant["key_message_points"]
-                if not points or not isinstance(points, list):
+            # Content quality checks for promo_blurb
+            if content_quality and "promo_blurb" in program:
+                blurb = program["promo_blurb"]
+                if len(blurb.split()) < 5:
                     validation_issues.append(
-                        f"Restaurant '{restaurant_id}' has empty or invalid key_message_points")
-                elif content_quality:
-                    # Check if key messages are effective (3-7 words is ideal for a key message)
-                    for j, point in enumerate(points):
-                        words = point.split()
-                        if len(words) < 3:
+                        f"Restaurant '{restaurant_id}' loyalty program promo_blurb is too short. Aim for at least 5 words.")
+        
+        # Validate promotional offers
+        if "promotional_offers" in marketing:
+            offers = marketing["promotional_offers"]
+            if not isinstance(offers, list):
+                validation_issues.append(
+                    f"Restaurant '{restaurant_id}' promotional_offers must be a list")
+            else:
+                for j, offer in enumerate(offers):
+                    # Check if timestamps make sense (end time after start time)
+                    if "start_time" in offer and "end_time" in offer:
+                        if offer["start_time"] > offer["end_time"]:
+                            validation_issues.append(
+                                f"Promotional offer '{offer.get('offer_name', 'unnamed')}' has end_time before start_time")
+                    
+                    # Content quality checks for marketing_copy
+                    if content_quality and "marketing_copy" in offer:
+                        copy = offer["marketing_copy"]
+                        if len(copy.split()) < 5:
                             validation_issues.append(
-                                f"Restaurant '{restaurant_id}' key_message_point[{j}] is too short ({len(words)} words). Aim for 3-7 words.")
-                        elif len(words) > 10:
+                                f"Restaurant '{restaurant_id}' promotional_offer[{j}] marketing_copy is too short. Aim for at least 5 words.")
+                        if '!' not in copy and '?' not in copy:
                             validation_issues.append(
-                                f"Restaurant '{restaurant_id}' key_message_point[{j}] is too long ({len(words)} words). Aim for 3-7 words.")
+                                f"Restaurant '{restaurant_id}' promotional_offer[{j}] marketing_copy may be more engaging with exclamation or question marks.")
+        
+        # Validate social media strategy
+        if "social_media_strategy" in marketing:
+            social = marketing["social_media_strategy"]
             
-            # Check suggested_prompt_template
-            if "suggested_prompt_template" in restaurant:
-                template = restaurant["suggested_prompt_template"]
-                if not template or not isinstance(template, str):
+            # Check for required fields
+            for field in ("platforms", "hashtags"):
+                if field not in social or not isinstance(social[field], list) or not social[field]:
                     validation_issues.append(
-                        f"Restaurant '{restaurant_id}' has empty or invalid suggested_prompt_template")
-                else:
-                    variables = ["restaurant_name", "key_message_points", "length"]
-                    for var in variables:
-                        if '{' + var + '}' not in template:
-                            validation_issues.append(
-                                f"Restaurant '{restaurant_id}' suggested_prompt_template should include {{{var}}}")
+                        f"Restaurant '{restaurant_id}' social_media_strategy must include non-empty {field} list")
             
-            # Check marketing_extension
-            if "marketing_extension" in restaurant:
-                marketing = restaurant["marketing_extension"]
+            # Content quality checks for social_media_blurb
+            if content_quality and "social_media_blurb" in social:
+                blurb = social["social_media_blurb"]
+                words = blurb.split()
+                if len(words) < 10:
+                    validation_issues.append(
+                        f"Restaurant '{restaurant_id}' social_media_blurb is too short ({len(words)} words). Aim for at least 10 words.")
                 
-                # Validate loyalty program
-                if "loyalty_program" in marketing:
-                    program = marketing["loyalty_program"]
-                    if "tiers" in program and (not program["tiers"] or not isinstance(program["tiers"], list)):
-                        validation_issues.append(
-                            f"Restaurant '{restaurant_id}' has invalid loyalty program tiers")
-                    
-                    # Content quality checks for promo_blurb
-                    if content_quality and "promo_blurb" in program:
-                        blurb = program["promo_blurb"]
-                        if len(blurb.split()) < 5:
+                # Check hashtags format
+                if "hashtags" in social:
+                    for hashtag in social["hashtags"]:
+                        if not hashtag.startswith("#"):
                             validation_issues.append(
-                                f"Restaurant '{restaurant_id}' loyalty program promo_blurb is too short. Aim for at least 5 words.")
-                
-                # Validate promotional offers
-                if "promotional_offers" in marketing:
-                    offers = marketing["promotional_offers"]
-                    if not isinstance(offers, list):
+                                f"Restaurant '{restaurant_id}' hashtag '{hashtag}' should start with #")
+        
+        # Check call to action fields
+        if "website_cta" in marketing:
+            cta = marketing["website_cta"]
+            if "button_text" in cta and len(cta["button_text"]) < 2:
+                validation_issues.append(
+                    f"Restaurant '{restaurant_id}' website_cta button_text is too short")
+            if "target_url" in cta and not cta["target_url"].startswith("http"):
+                validation_issues.append(
+                    f"Restaurant '{restaurant_id}' website_cta target_url should start with http:// or https://")
+    
+    return validation_issues
+
+
+def _check_dish(dish: Dict, content_quality: bool = False) -> List[str]:
+    """Return the narrative, supplier and v1.2 field issues for one dish."""
+    validation_issues = []
+    dish_id = dish.get("id", "unknown")
+    dish_name = dish.get("name", dish_id)
+    
+    # Check for translated strings
+    for field in _present_fields(dish, NARRATIVE_FIELDS, _NARRATIVE_SET):
+        translated = dish[field]
+        if not isinstance(translated, dict) or "translations" not in translated:
+            validation_issues.append(
+                f"Dish '{dish_id}' has invalid {field} format - must use TranslatedString format")
+        elif "translations" in translated:
+            translations = translated["translations"]
+            if not translations or not isinstance(translations, dict):
+                validation_issues.append(
+                    f"Dish '{dish_id}' has empty or invalid translations in {field}")
+            else:
+                for lang_code, content in translations.items():
+                    # Check language code format
+                    if not (len(lang_code) == 2 and not lang_code.strip(string.ascii_lowercase)):
                         validation_issues.append(
-                            f"Restaurant '{restaurant_id}' promotional_offers must be a list")
-                    else:
-                        for j, offer in enumerate(offers):
-                            # Check if timestamps make sense (end time after start time)
-                            if "start_time" in offer and "end_time" in offer:
-                                if offer["start_time"] > offer["end_time"]:
-                                    validation_issues.append(
-                                        f"Promotional offer '{offer.get('offer_name', 'unnamed')}' has end_time before start_time")
-                            
-                            # Content quality checks for marketing_copy
-                            if content_quality and "marketing_copy" in offer:
-                                copy = offer["marketing_copy"]
-                                if len(copy.split()) < 5:
-                                    validation_issues.append(
-                                        f"Restaurant '{restaurant_id}' promotional_offer[{j}] marketing_copy is too short. Aim for at least 5 words.")
-                                if not any(p in copy for p in "!?"):
-                                    validation_issues.append(
-                                        f"Restaurant '{restaurant_id}' promotional_offer[{j}] marketing_copy may be more engaging with exclamation or question marks.")
-                
-                # Validate social media strategy
-                if "social_media_strategy" in marketing:
-                    social = marketing["social_media_strategy"]
+                            f"Dish '{dish_id}' has invalid language code '{lang_code}' in {field}")
                     
-                    # Check for required fields
-                    for field in ["platforms", "hashtags"]:
-                        if field not in social or not isinstance(social[field], list) or not social[field]:
+                    # Content quality checks if enabled
+                    if content_quality:
+                        word_count, char_sum, ends_with_punct = _text_stats(content)
+                        # Check content length
+                        if field == "chef_highlight" and word_count > 50:
                             validation_issues.append(
-                                f"Restaurant '{restaurant_id}' social_media_strategy must include non-empty {field} list")
-                    
-                    # Content quality checks for social_media_blurb
-                    if content_quality and "social_media_blurb" in social:
-                        blurb = social["social_media_blurb"]
-                        words = blurb.split()
-                        if len(words) < 10:
+                                f"Dish '{dish_id}' {field} is too long ({word_count} words). Aim for under 50 words.")
+                        elif field == "chef_highlight" and word_count < 10:
+                            validation_issues.append(
+                                f"Dish '{dish_id}' {field} is too short ({word_count} words). Aim for at least 10 words.")
+                        elif field in _LONG_NARRATIVE_FIELDS and word_count < 30:
                             validation_issues.append(
-                                f"Restaurant '{restaurant_id}' social_media_blurb is too short ({len(words)} words). Aim for at least 10 words.")
+                                f"Dish '{dish_id}' {field} is too short ({word_count} words). Aim for at least 30 words.")
                         
-                        # Check hashtags format
-                        if "hashtags" in social:
-                            for hashtag in social["hashtags"]:
-                                if not hashtag.startswith("#"):
-                                    validation_issues.append(
-                                        f"Restaurant '{restaurant_id}' hashtag '{hashtag}' should start with #")
-                
-                # Check call to action fields
-                if "website_cta" in marketing:
-                    cta = marketing["website_cta"]
-                    if "button_text" in cta and len(cta["button_text"]) < 2:
-                        validation_issues.append(
-                            f"Restaurant '{restaurant_id}' website_cta button_text is too short")
-                    if "target_url" in cta and not cta["target_url"].startswith("http"):
-                        validation_issues.append(
-                            f"Restaurant '{restaurant_id}' website_cta target_url should start with http:// or https://")
-    
-    # Check dish narrative fields
-    if "dishes" in feed:
-        for dish in feed["dishes"]:
-            dish_id = dish.get("id", "unknown")
-            dish_name = dish.get("name", dish_id)
-            
-            # Check for translated strings
-            narrative_fields = ["chef_story", "chef_highlight", "chef_anecdote", "culinary_philosophy", 
-                               "seasonal_story", "cultural_context", "ingredient_story"]
-            
-            for field in narrative_fields:
-                if field in dish:
-                    translated = dish[field]
-                    if not isinstance(translated, dict) or "translations" not in translated:
-                        validation_issues.append(
-                            f"Dish '{dish_id}' has invalid {field} format - must use TranslatedString format")
-                    elif "translations" in translated:
-                        translations = translated["translations"]
-                        if not translations or not isinstance(translations, dict):
+                        # Check punctuation and readability
+                        if content and not ends_with_punct:
                             validation_issues.append(
-                                f"Dish '{dish_id}' has empty or invalid translations in {field}")
-                        else:
-                            for lang_code, content in translations.items():
-                                # Check language code format
-                                if not re.match(r'^[a-z]{2}$', lang_code):
-                                    validation_issues.append(
-                                        f"Dish '{dish_id}' has invalid language code '{lang_code}' in {field}")
-                                
-                                # Content quality checks if enabled
-                                if content_quality:
-                                    words = content.split()
-                                    # Check content length
-                                    if field == "chef_highlight" and len(words) > 50:
-                                        validation_issues.append(
-                                            f"Dish '{dish_id}' {field} is too long ({len(words)} words). Aim for under 50 words.")
-                                    elif field == "chef_highlight" and len(words) < 10:
-                                        validation_issues.append(
-                                            f"Dish '{dish_id}' {field} is too short ({len(words)} words). Aim for at least 10 words.")
-                                    elif field in ["chef_story", "seasonal_story", "cultural_context"] and len(words) < 30:
-                                        validation_issues.append(
-                                            f"Dish '{dish_id}' {field} is too short ({len(words)} words). Aim for at least 30 words.")
-                                    
-                                    # Check punctuation and readability
-                                    if len(content) > 0 and content[-1] not in [".", "!", "?"]:
-                                        validation_issues.append(
-                                            f"Dish '{dish_id}' {field} should end with proper punctuation.")
-                                    
-                                    # Check for dish name inclusion
-                                    if dish_name.lower() not in content.lower() and len(words) > 20:
-                                        validation_issues.append(
-                                            f"Dish '{dish_id}' {field} should mention the dish name '{dish_name}' for better SEO.")
-                                    
-                                    # Check for text quality metrics
-                                    if len(words) > 15:
-                                        # Average word length (too high might indicate overly complex language)
-                                        avg_word_len = sum(len(word) for word in words) / len(words)
-                                        if avg_word_len > 8:
-                                            validation_issues.append(
-                                                f"Dish '{dish_id}' {field} has high average word length ({avg_word_len:.1f}). Consider simplifying language.")
-                                        
-                                        # Check for sentence variety
-                                        sentences = re.split(r'[.!?]+', content)
-                                        sentences = [s.strip() for s in sentences if s.strip()]
-                                        if len(sentences) > 1:
-                                            sent_lengths = [len(s.split()) for s in sentences]
-                                            if max(sent_lengths) == min(sent_lengths):
-                                                validation_issues.append(
-                                                    f"Dish '{dish_id}' {field} has uniform sentence lengths. Consider varying sentence structure.")
-            
-            # Check supplier information and sustainability impact
-            if "supplier_location" in dish:
-                location = dish["supplier_location"]
-                # Check coordinate ranges
-                if "latitude" in location and (location["latitude"] < -90 or location["latitude"] > 90):
-                    validation_issues.append(
-                        f"Dish '{dish_id}' has invalid latitude in supplier_location: {location['latitude']}")
-                if "longitude" in location and (location["longitude"] < -180 or location["longitude"] > 180):
-                    validation_issues.append(
-                        f"Dish '{dish_id}' has invalid longitude in supplier_location: {location['longitude']}")
-                
-                # Check for completeness
-                if "detailed" in location:
-                    detailed = location["detailed"]
-                    required_fields = ["street_address", "locality", "state", "country"]
-                    missing = [f for f in required_fields if f not in detailed or not detailed[f]]
-                    if missing:
-                        validation_issues.append(
-                            f"Dish '{dish_id}' supplier_location.detailed is missing: {', '.join(missing)}")
-            
-            if "supplier_certification" in dish and len(dish["supplier_certification"]) < 2:
+                                f"Dish '{dish_id}' {field} should end with proper punctuation.")
+                        
+                        # Check for dish name inclusion
+                        if word_count > 20 and dish_name.lower() not in content.lower():
+                            validation_issues.append(
+                                f"Dish '{dish_id}' {field} should mention the dish name '{dish_name}' for better SEO.")
+                        
+                        # Check for text quality metrics
+                        if word_count > 15:
+                            # Average word length (too high might indicate overly complex language)
+                            avg_word_len = char_sum / word_count
+                            if avg_word_len > 8:
+                                validation_issues.append(
+                                    f"Dish '{dish_id}' {field} has high average word length ({avg_word_len:.1f}). Consider simplifying language.")
+                            
+                            # Check for sentence variety
+                            if _has_uniform_sentences(content):
+                                validation_issues.append(
+                                    f"Dish '{dish_id}' {field} has uniform sentence lengths. Consider varying sentence structure.")
+
+    # Check supplier information and sustainability impact
+    if "supplier_location" in dish:
+        location = dish["supplier_location"]
+        # Check coordinate ranges
+        if "latitude" in location:
+            latitude = location["latitude"]
+            if latitude < -90 or latitude > 90:
                 validation_issues.append(
-                    f"Dish '{dish_id}' has invalid supplier_certification: too short")
-            
-            if "farm_distance" in dish:
-                distance = dish["farm_distance"]
-                if not isinstance(distance, (int, float)) or distance <= 0:
-                    validation_issues.append(
-                        f"Dish '{dish_id}' has invalid farm_distance: {distance}. Must be a positive number.")
-                elif distance > 500:
+                    f"Dish '{dish_id}' has invalid latitude in supplier_location: {latitude}")
+        if "longitude" in location:
+            longitude = location["longitude"]
+            if longitude < -180 or longitude > 180:
+                validation_issues.append(
+                    f"Dish '{dish_id}' has invalid longitude in supplier_location: {longitude}")
+        
+        # Check for completeness
+        if "detailed" in location:
+            detailed = location["detailed"]
+            missing = [f for f in SUPPLIER_ADDRESS_FIELDS if not detailed.get(f)]
+            if missing:
+                validation_issues.append(
+                    f"Dish '{dish_id}' supplier_location.detailed is missing: {', '.join(missing)}")
+    
+    if "supplier_certification" in dish and len(dish["supplier_certification"]) < 2:
+        validation_issues.append(
+            f"Dish '{dish_id}' has invalid supplier_certification: too short")
+    
+    if "farm_distance" in dish:
+        distance = dish["farm_distance"]
+        if not isinstance(distance, (int, float)) or distance <= 0:
+            validation_issues.append(
+                f"Dish '{dish_id}' has invalid farm_distance: {distance}. Must be a positive number.")
+        elif distance > 500:
+            validation_issues.append(
+                f"Warning: Dish '{dish_id}' has a large farm_distance: {distance}. Verify if this is correct.")
+    
+    if "sustainability_impact" in dish:
+        impact = dish["sustainability_impact"]
+        if not isinstance(impact, str) or len(impact) < 10:
+            validation_issues.append(
+                f"Dish '{dish_id}' has invalid sustainability_impact: too short. Aim for at least 10 words.")
+    
+    # Check upgrade options (now an array in v1.2)
+    if "upgrade_options" in dish:
+        options = dish["upgrade_options"]
+        if not isinstance(options, list):
+            validation_issues.append(
+                f"Dish '{dish_id}' upgrade_options must be an array")
+        else:
+            for i, option in enumerate(options):
+                if not isinstance(option, dict):
                     validation_issues.append(
-                        f"Warning: Dish '{dish_id}' has a large farm_distance: {distance}. Verify if this is correct.")
-            
-            if "sustainability_impact" in dish:
-                impact = dish["sustainability_impact"]
-                if not isinstance(impact, str) or len(impact) < 10:
+                        f"Dish '{dish_id}' upgrade_options[{i}] must be an object")
+                    continue
+                    
+                if "new_name" not in option or not option["new_name"]:
                     validation_issues.append(
-                        f"Dish '{dish_id}' has invalid sustainability_impact: too short. Aim for at least 10 words.")
-            
-            # Check upgrade options (now an array in v1.2)
-            if "upgrade_options" in dish:
-                options = dish["upgrade_options"]
-                if not isinstance(options, list):
+                        f"Dish '{dish_id}' upgrade_options[{i}] is missing new_name")
+                        
+                if "new_price" in option and not isinstance(option["new_price"], (int, float)):
                     validation_issues.append(
-                        f"Dish '{dish_id}' upgrade_options must be an array")
-                else:
-                    for i, option in enumerate(options):
-                        if not isinstance(option, dict):
-                            validation_issues.append(
-                                f"Dish '{dish_id}' upgrade_options[{i}] must be an object")
-                            continue
-                            
-                        if "new_name" not in option or not option["new_name"]:
-                            validation_issues.append(
-                                f"Dish '{dish_id}' upgrade_options[{i}] is missing new_name")
-                                
-                        if "new_price" in option and not isinstance(option["new_price"], (int, float)):
-                            validation_issues.append(
-                                f"Dish '{dish_id}' upgrade_options[{i}] has invalid new_price")
-                                
-                        if "marketing_copy" not in option or not option["marketing_copy"]:
-                            validation_issues.append(
-                                f"Dish '{dish_id}' upgrade_options[{i}] is missing marketing_copy")
-            
-            # Check LTO details (new in v1.2)
-            if "lto_details" in dish:
-                lto = dish["lto_details"]
-                if not isinstance(lto, dict):
+                        f"Dish '{dish_id}' upgrade_options[{i}] has invalid new_price")
+                        
+                if "marketing_copy" not in option or not option["marketing_copy"]:
                     validation_issues.append(
-                        f"Dish '{dish_id}' lto_details must be an object")
-                else:
-                    # Validate required fields
-                    if "start_time" not in lto or not isinstance(lto["start_time"], (int)):
-                        validation_issues.append(
-                            f"Dish '{dish_id}' lto_details is missing valid start_time")
-                            
-                    if "end_time" not in lto or not isinstance(lto["end_time"], (int)):
-                        validation_issues.append(
-                            f"Dish '{dish_id}' lto_details is missing valid end_time")
-                    
-                    # Check that end_time is after start_time
-                    if "start_time" in lto and "end_time" in lto and lto["start_time"] >= lto["end_time"]:
-                        validation_issues.append(
-                            f"Dish '{dish_id}' lto_details has end_time that is not after start_time")
+                        f"Dish '{dish_id}' upgrade_options[{i}] is missing marketing_copy")
+    
+    # Check LTO details (new in v1.2)
+    if "lto_details" in dish:
+        lto = dish["lto_details"]
+        if not isinstance(lto, dict):
+            validation_issues.append(
+                f"Dish '{dish_id}' lto_details must be an object")
+        else:
+            # Validate required fields
+            if "start_time" not in lto or not isinstance(lto["start_time"], (int)):
+                validation_issues.append(
+                    f"Dish '{dish_id}' lto_details is missing valid start_time")
                     
-                    if "marketing_copy" not in lto or not isinstance(lto["marketing_copy"], str) or len(lto["marketing_copy"]) < 10:
-                        validation_issues.append(
-                            f"Dish '{dish_id}' lto_details is missing or has too short marketing_copy")
+            if "end_time" not in lto or not isinstance(lto["end_time"], (int)):
+                validation_issues.append(
+                    f"Dish '{dish_id}' lto_details is missing valid end_time")
             
-            # Check customer feedback summary (new in v1.2)
-            if "customer_feedback_summary" in dish:
-                feedback = dish["customer_feedback_summary"]
-                if not isinstance(feedback, str) or len(feedback) < 5:
-                    validation_issues.append(
-                        f"Dish '{dish_id}' has invalid customer_feedback_summary: too short")
+            # Check that end_time is after start_time
+            if "start_time" in lto and "end_time" in lto and lto["start_time"] >= lto["end_time"]:
+                validation_issues.append(
+                    f"Dish '{dish_id}' lto_details has end_time that is not after start_time")
+            
+            if "marketing_copy" not in lto or not isinstance(lto["marketing_copy"], str) or len(lto["marketing_copy"]) < 10:
+                validation_issues.append(
+                    f"Dish '{dish_id}' lto_details is missing or has too short marketing_copy")
+    
+    # Check customer feedback summary (new in v1.2)
+    if "customer_feedback_summary" in dish:
+        feedback = dish["customer_feedback_summary"]
+        if not isinstance(feedback, str) or len(feedback) < 5:
+            validation_issues.append(
+                f"Dish '{dish_id}' has invalid customer_feedback_summary: too short")
+    
+    return validation_issues
+
+
+def _check_dishes(dishes: Iterable[Dict], content_quality: bool = False,
+                  workers: int = 1) -> Iterator[Tuple[Dict, List[str]]]:
+    """Yield (dish, issues) in feed order, checking dishes in a process pool when workers > 1."""
+    if workers <= 1:
+        for dish in dishes:
+            yield dish, _check_dish(dish, content_quality)
+        return
+    
+    check = functools.partial(_check_dish, content_quality=content_quality)
+    dishes = iter(dishes)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            batch = list(itertools.islice(dishes, DISH_BATCH_SIZE))
+            if not batch:
+                break
+            chunksize = max(1, len(batch) // (4 * workers))
+            yield from zip(batch, executor.map(check, batch, chunksize=chunksize))
+
+
+def _check_bundle(bundle: Dict) -> List[str]:
+    """Return the issues for one bundle."""
+    validation_issues = []
+    bundle_id = bundle.get("bundle_id", "unknown")
+    
+    # Check bundle name
+    if "bundle_name" not in bundle or not bundle["bundle_name"]:
+        validation_issues.append(f"Bundle '{bundle_id}' must have a bundle_name")
+    
+    # Check included_items
+    if "included_items" not in bundle or not bundle["included_items"]:
+        validation_issues.append(f"Bundle '{bundle_id}' must have at least one item in included_items")
+    
+    # Check bundle price
+    if "bundle_price" not in bundle or not isinstance(bundle["bundle_price"], (int, float)) or bundle["bundle_price"] <= 0:
+        validation_issues.append(f"Bundle '{bundle_id}' must have a valid bundle_price greater than zero")
+    
+    # Check marketing copy
+    if "bundle_marketing_copy" in bundle and (not isinstance(bundle["bundle_marketing_copy"], str) or len(bundle["bundle_marketing_copy"]) < 10):
+        validation_issues.append(f"Bundle '{bundle_id}' has invalid or too short bundle_marketing_copy")
+    
+    return validation_issues
+
+
+def _collect_restaurant_seo(restaurant: Dict, texts: List[str], keywords: Set[str]) -> None:
+    """Add a restaurant's key message points and marketing texts to the SEO inputs."""
+    # Add key message points to keywords
+    if "key_message_points" in restaurant:
+        keywords.update(point.lower() for point in restaurant["key_message_points"])
+    
+    # Add marketing extension texts
+    if "marketing_extension" in restaurant:
+        marketing = restaurant["marketing_extension"]
+        
+        if "loyalty_program" in marketing and "promo_blurb" in marketing["loyalty_program"]:
+            texts.append(marketing["loyalty_program"]["promo_blurb"])
+        
+        if "promotional_offers" in marketing:
+            for offer in marketing["promotional_offers"]:
+                if "marketing_copy" in offer:
+                    texts.append(offer["marketing_copy"])
+        
+        if "social_media_strategy" in marketing and "social_media_blurb" in marketing["social_media_strategy"]:
+            texts.append(marketing["social_media_strategy"]["social_media_blurb"])
+
+
+def _collect_dish_seo(dish: Dict, texts: List[str], keywords: Set[str]) -> None:
+    """Add a dish's name and narrative texts to the SEO inputs."""
+    dish_name = dish.get("name", dish.get("id", "unknown"))
+    keywords.add(dish_name.lower())
+    
+    # Add narrative fields
+    for field in _present_fields(dish, SEO_NARRATIVE_FIELDS, _SEO_NARRATIVE_SET):
+        if "translations" in dish[field]:
+            for lang, text in dish[field]["translations"].items():
+                texts.append(text)
+
+
+def _seo_words(text: str) -> Iterator[str]:
+    """Return the lowercased words of text with surrounding punctuation stripped."""
+    return map(str.strip, text.lower().split(), itertools.repeat(string.punctuation))
+
+
+def _check_seo(texts: List[str], keywords: Set[str]) -> Tuple[List[str], List[str]]:
+    """Analyze the collected marketing texts and return (recommendations, analysis report lines)."""
+    issues = []
+    if not texts:
+        return issues, []
+    
+    # Get word frequencies excluding common stopwords, counted straight from the token stream
+    word_count = Counter(
+        word for text in texts for word in _seo_words(text) if word and word not in _SEO_STOPWORDS
+    )
+    most_common = word_count.most_common(10)
+    
+    # Check if keywords are being used consistently
+    keyword_usage = {}
+    for k in keywords:
+        term = k.strip(string.punctuation)
+        if term:
+            keyword_usage[k] = word_count.get(term, 0)
+    unused_keywords = [k for k, count in keyword_usage.items() if count == 0]
+    low_use_keywords = [k for k, count in keyword_usage.items() if 0 < count < 3 and len(texts) > 5]
+    
+    # Add SEO recommendations
+    if unused_keywords:
+        issues.append(
+            f"SEO: Some key terms are not used in marketing text: {', '.join(unused_keywords)}")
+    
+    if low_use_keywords:
+        issues.append(
+            f"SEO: Some key terms have low usage in marketing text: {', '.join(low_use_keywords)}")
+    
+    # Build the SEO analysis for the caller to print once the issue list is done
+    report = [
+        "\nSEO Analysis:",
+        f"  Total marketing texts analyzed: {len(texts)}",
+        f"  Most frequent words used: {', '.join([f'{word} ({count})' for word, count in most_common])}",
+        f"  Key term usage: {', '.join([f'{k} ({v})' for k, v in keyword_usage.items() if v > 0])}",
+    ]
+    
+    return issues, report
+
+
+def iter_feed_section(json_file_path: str, prefix: str):
+    """Yield the items at an ijson prefix (e.g. "dishes.item") without loading the whole feed."""
+    with open(json_file_path, "rb") as feed_file:
+        yield from ijson.items(feed_file, prefix, use_float=True)
+
+
+def _iter_marketing_issues(restaurants: Iterable[Dict], dishes: Iterable[Dict], bundles: Iterable[Dict],
+                           content_quality: bool = False, seo_check: bool = False,
+                           workers: int = 1, seo_report: Optional[List[str]] = None) -> Iterator[str]:
+    """Yield marketing field issues for restaurants, dishes, bundles and then SEO, as they are found.
+    
+    The SEO analysis lines are appended to seo_report when it is given.
+    """
+    # SEO inputs are collected while the sections are checked
+    all_marketing_text = []
+    keywords = set()
+    
+    # Check restaurant marketing extensions
+    for i, restaurant in enumerate(restaurants):
+        yield from _check_restaurant(restaurant, i, content_quality)
+        if seo_check:
+            _collect_restaurant_seo(restaurant, all_marketing_text, keywords)
+    
+    # Check dish narrative fields
+    for dish, issues in _check_dishes(dishes, content_quality, workers):
+        yield from issues
+        if seo_check:
+            _collect_dish_seo(dish, all_marketing_text, keywords)
     
     # Check bundle fields
-    if "bundles" in feed:
-        for bundle in feed["bundles"]:
-            bundle_id = bundle.get("bundle_id", "unknown")
-            
-            # Check bundle name
-            if "bundle_name" not in bundle or not bundle["bundle_name"]:
-                validation_issues.append(f"Bundle '{bundle_id}' must have a bundle_name")
-            
-            # Check included_items
-            if "included_items" not in bundle or not bundle["included_items"]:
-                validation_issues.append(f"Bundle '{bundle_id}' must have at least one item in included_items")
-            
-            # Check bundle price
-            if "bundle_price" not in bundle or not isinstance(bundle["bundle_price"], (int, float)) or bundle["bundle_price"] <= 0:
-                validation_issues.append(f"Bundle '{bundle_id}' must have a valid bundle_price greater than zero")
-            
-            # Check marketing copy
-            if "bundle_marketing_copy" in bundle and (not isinstance(bundle["bundle_marketing_copy"], str) or len(bundle["bundle_marketing_copy"]) < 10):
-                validation_issues.append(f"Bundle '{bundle_id}' has invalid or too short bundle_marketing_copy")
+    for bundle in bundles:
+        yield from _check_bundle(bundle)
     
     # Check for SEO best practices if requested
-    if seo_check and ("restaurants" in feed or "dishes" in feed):
-        # Collect all narrative content for SEO analysis
-        all_marketing_text = []
-        keywords = set()
-        
-        # Extract restaurant marketing texts
-        if "restaurants" in feed:
-            for restaurant in feed["restaurants"]:
-                restaurant_id = restaurant.get("id", "unknown")
-                restaurant_name = restaurant.get("name", restaurant_id)
-                
-                # Add key message points to keywords
-                if "key_message_points" in restaurant:
-                    keywords.update([point.lower() for point in restaurant["key_message_points"]])
-                
-                # Add marketing extension texts
-                if "marketing_extension" in restaurant:
-                    marketing = restaurant["marketing_extension"]
-                    
-                    if "loyalty_program" in marketing and "promo_blurb" in marketing["loyalty_program"]:
-                        all_marketing_text.append(marketing["loyalty_program"]["promo_blurb"])
-                    
-                    if "promotional_offers" in marketing:
-                        for offer in marketing["promotional_offers"]:
-                            if "marketing_copy" in offer:
-                                all_marketing_text.append(offer["marketing_copy"])
-                    
-                    if "social_media_strategy" in marketing and "social_media_blurb" in marketing["social_media_strategy"]:
-                        all_marketing_text.append(marketing["social_media_strategy"]["social_media_blurb"])
+    if seo_check:
+        seo_issues, report = _check_seo(all_marketing_text, keywords)
+        if seo_report is not None:
+            seo_report.extend(report)
+        yield from seo_issues
+
+
+def validate_marketing_fields(json_file_path: str, content_quality: bool = False, seo_check: bool = False,
+                              streaming: bool = False, workers: int = 1, max_errors: int = 0) -> bool:
+    """Perform extended validation on ORFS v1.1 marketing fields.
+    
+    With streaming=True and ijson installed, restaurants, dishes and bundles
+    are parsed and checked one at a time instead of loading the whole feed.
+    Dish checks run in a pool of worker processes when workers > 1.
+    Issues are printed as they are found; validation stops after max_errors
+    issues when it is set.
+    """
+    if streaming and ijson is None:
+        logging.warning("ijson is not installed; loading the whole feed instead of streaming it")
+        streaming = False
+    
+    if streaming:
+        header = None
+        restaurants = iter_feed_section(json_file_path, "restaurants.item")
+        dishes = iter_feed_section(json_file_path, "dishes.item")
+        bundles = iter_feed_section(json_file_path, "bundles.item")
+    else:
+        feed = load_json_file(json_file_path)
+        if feed is None:
+            return False
+        header = feed.get("header", {})
+        restaurants = feed.get("restaurants", [])
+        dishes = feed.get("dishes", [])
+        bundles = feed.get("bundles", [])
+    
+    issue_count = 0
+    limit_hit = False
+    seo_report = []
+    try:
+        if header is None:
+            header = next(iter_feed_section(json_file_path, "header"), {})
         
-        # Extract dish narrative texts
-        if "dishes" in feed:
-            for dish in feed["dishes"]:
-                dish_name = dish.get("name", dish.get("id", "unknown"))
-                keywords.add(dish_name.lower())
-                
-                # Add narrative fields
-                narrative_fields = ["chef_story", "chef_highlight", "seasonal_story", "cultural_context", "ingredient_story"]
-                for field in narrative_fields:
-                    if field in dish and "translations" in dish[field]:
-                        for lang, text in dish[field]["translations"].items():
-                            all_marketing_text.append(text)
+        # Check ORFS version
+        version = header.get("version", "1.0")
+        if version != "1.1":
+            logging.warning(f"Marketing fields validation is designed for ORFS v1.1, detected version: {version}")
         
-        # Perform SEO analysis
-        if all_marketing_text:
-            # Get unique words excluding common stopwords (simplified list)
-            stopwords = {"a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for", "is", "are", "was", "were"}
-            all_words = []
-            for text in all_marketing_text:
-                words = [word.lower().strip(string.punctuation) for word in text.split()]
-                all_words.extend([w for w in words if w and w not in stopwords])
-            
-            # Get word frequencies
-            word_count = Counter(all_words)
-            most_common = word_count.most_common(10)
-            
-            # Check if keywords are being used consistently
-            keyword_usage = {k: word_count.get(k.strip(string.punctuation), 0) for k in keywords if k.strip(string.punctuation)}
-            unused_keywords = [k for k, count in keyword_usage.items() if count == 0]
-            low_use_keywords = [k for k, count in keyword_usage.items() if 0 < count < 3 and len(all_marketing_text) > 5]
-            
-            # Add SEO recommendations
-            if unused_keywords:
-                validation_issues.append(
-                    f"SEO: Some key terms are not used in marketing text: {', '.join(unused_keywords)}")
-            
-            if low_use_keywords:
-                validation_issues.append(
-                    f"SEO: Some key terms have low usage in marketing text: {', '.join(low_use_keywords)}")
-            
-            # Print SEO analysis
-            print(f"\nSEO Analysis:")
-            print(f"  Total marketing texts analyzed: {len(all_marketing_text)}")
-            print(f"  Most frequent words used: {', '.join([f'{word} ({count})' for word, count in most_common])}")
-            print(f"  Key term usage: {', '.join([f'{k} ({v})' for k, v in keyword_usage.items() if v > 0])}")
+        # Report issues as they are found
+        issues = _iter_marketing_issues(restaurants, dishes, bundles, content_quality, seo_check, workers,
+                                        seo_report)
+        for issue in issues:
+            if issue_count == 0:
+                print("\n❌ Issues with marketing fields:")
+            print(f"  - {issue}")
+            issue_count += 1
+            if max_errors and issue_count >= max_errors:
+                print(f"\nStopped after {max_errors} issues (--max-errors)")
+                limit_hit = True
+                break
+    except (FileNotFoundError, *_STREAM_ERRORS) as e:
+        logging.error(f"Could not load file {json_file_path}: {e}")
+        return False
+    
+    # Print the SEO analysis after the issue list so it does not split it
+    for line in seo_report:
+        print(line)
     
     # Report validation results
-    if validation_issues:
-        print(f"\n❌ Found {len(validation_issues)} issues with marketing fields:")
-        for issue in validation_issues:
-            print(f"  - {issue}")
+    if issue_count:
+        print(f"\n❌ Found {'at least ' if limit_hit else ''}{issue_count} issues with marketing fields")
         return False
     else:
         print(f"\n✅ Marketing fields in {json_file_path} pass enhanced validation checks!")
@@ -537,12 +1248,20 @@ def main():
     parser = argparse.ArgumentParser(description='Validate ORFS feeds')
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument('--static', help='Path to static JSON feed file to validate')
+    group.add_argument('--static-dir', help='Directory of static JSON feed files to validate')
     group.add_argument('--realtime', help='Path to realtime Protocol Buffer or JSON feed file to validate')
     group.add_argument('--marketing-check', help='Perform enhanced validation on marketing fields in v1.1 feeds')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
     parser.add_argument('--content-quality', action='store_true', help='Enable enhanced content quality checks for marketing narrative')
     parser.add_argument('--seo-check', action='store_true', help='Enable SEO optimization checks for marketing content')
     parser.add_argument('--all-checks', action='store_true', help='Enable all enhanced validation checks')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for --static-dir feeds and --marketing-check dish checks (default: 1, 0 = one per CPU)')
+    parser.add_argument('--delimited', action='store_true',
+                        help='Treat a binary --realtime feed as a stream of length-delimited FeedMessages')
+    parser.add_argument('--max-errors', type=int, default=0,
+                        help='Stop --marketing-check, or --static with --verbose, after this many issues (default: 0, no limit)')
+    parser.add_argument('--streaming', action='store_true', help='Stream-parse the feed with ijson instead of loading it whole (--static does this automatically for large feeds)')
     
     args = parser.parse_args()
     
@@ -550,9 +1269,12 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     if args.static:
-        success = validate_static_feed(args.static)
+        success = validate_static_feed(args.static, all_errors=args.verbose, streaming=args.streaming or None,
+                                       max_errors=args.max_errors)
+    elif args.static_dir:
+        success = validate_static_dir(args.static_dir, workers=args.workers or os.cpu_count() or 1)
     elif args.realtime:
-        success = validate_realtime_feed(args.realtime)
+        success = validate_realtime_feed(args.realtime, delimited=args.delimited)
     elif args.marketing_check:
         # Set content quality and SEO check flags
         content_quality = args.content_quality or args.all_checks
@@ -561,7 +1283,10 @@ def main():
         success = validate_marketing_fields(
             args.marketing_check, 
             content_quality=content_quality,
-            seo_check=seo_check
+            seo_check=seo_check,
+            streaming=args.streaming,
+            workers=args.workers or os.cpu_count() or 1,
+            max_errors=args.max_errors
         )
     
     sys.exit(0 if success else 1)